@@ -2,19 +2,24 @@
 from __future__ import annotations
 from typing import Any, Optional, Iterable, List, Dict
 from dataclasses import dataclass, field
-import textwrap
+import operator
 import pprint
+import sys
 
 _WRAP_WIDTH = 88
 
+# Printers reused by `pformat` (building one per call is pure overhead).
+_PP_SORT = pprint.PrettyPrinter(width=_WRAP_WIDTH, compact=False, sort_dicts=True)
+_PP_NOSORT = pprint.PrettyPrinter(width=_WRAP_WIDTH, compact=False, sort_dicts=False)
+
 #
 
 def _to_hashable(obj: Any) -> Any:
     """
     What it does:
         Recursively converts common mutable collections into their immutable,
-        hashable counterparts. Dictionaries are converted to deterministically
-        sorted tuples of (key, value) pairs to ensure consistent hashing.
+        hashable counterparts. Dictionaries are converted to frozensets of
+        (key, value) pairs, so insertion order never affects hashing.
 
     Its role in the library:
         This is a critical helper function for the `TraceCase` dataclass.
@@ -23,11 +28,14 @@ def _to_hashable(obj: Any) -> Any:
         Without this, you couldn't put cases with dicts or lists into a set.
     """
     if isinstance(obj, dict):
-        # Sort items by a stable key (type name, then repr) to avoid
-        # cross-type comparison errors and ensure deterministic order.
-        items = [(k, _to_hashable(v)) for k, v in obj.items()]
-        items.sort(key=lambda kv: (type(kv[0]).__name__, repr(kv[0])))
-        return tuple(items)
+        # Dict keys are already hashable; order is irrelevant for equality,
+        # so no sort (and no repr of every key) is needed.
+        # String keys repeat across thousands of entries: intern them so the
+        # keys share one object and equality short-circuits on identity.
+        return frozenset(
+            (sys.intern(k) if type(k) is str else k, _to_hashable(v))
+            for k, v in obj.items()
+        )
 
     if isinstance(obj, (list, tuple)):
         return tuple(_to_hashable(v) for v in obj)
@@ -41,7 +49,7 @@ def _to_hashable(obj: Any) -> Any:
     return obj
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TraceCase:
     """
     What it does:
@@ -64,54 +72,90 @@ class TraceCase:
     obj_args: Optional[dict] = None
     result_spec: Optional[dict] = None
     
-    # This field will store the hashable representation of the instance.
-    _key: tuple = field(init=False, repr=False, hash=False, compare=False)
+    # Hashable representation of the instance and its hash, computed on first use.
+    _key: Optional[tuple] = field(default=None, init=False, repr=False, hash=False, compare=False)
+    _hash: Optional[int] = field(default=None, init=False, repr=False, hash=False, compare=False)
 
-    def __post_init__(self):
-        """Computes a stable hash key after initialization."""
-        try:
-            # Sort kwargs by key to ensure order doesn't affect hashing.
-            kw_items = tuple(sorted(self.kwargs.items(), key=lambda item: str(item[0])))
-        except TypeError:
-            # Fallback for un-sortable keys (less common).
-            kw_items = tuple(self.kwargs.items())
-
-        # Use `object.__setattr__` because the dataclass is frozen.
-        object.__setattr__(
-            self,
-            "_key",
-            (
-                _to_hashable(self.args),
-                _to_hashable(kw_items),
-                _to_hashable(self.expected),
-                self.self_type,
-                _to_hashable(self.self_state),
-                _to_hashable(self.obj_args),
-                _to_hashable(self.result_spec),
-            ),
+    def _compute_key(self) -> tuple:
+        """Builds the hashable key (kwargs order doesn't matter, see `_to_hashable`)."""
+        return _key_from_fields(
+            self.args,
+            self.kwargs,
+            self.expected,
+            self.self_type,
+            self.self_state,
+            self.obj_args,
+            self.result_spec,
         )
 
+    def _ensure_key(self) -> tuple:
+        key = self._key
+        if key is None:
+            key = self._compute_key()
+            # Use `object.__setattr__` because the dataclass is frozen.
+            object.__setattr__(self, "_key", key)
+        return key
+
     def __hash__(self):
-        return hash(self._key)
+        h = self._hash
+        if h is None:
+            h = hash(self._ensure_key())
+            object.__setattr__(self, "_hash", h)
+        return h
 
     def __eq__(self, other):
         if not isinstance(other, TraceCase):
             return NotImplemented
-        return self._key == other._key
+        return self._ensure_key() == other._ensure_key()
 
     @classmethod
     def from_entry(cls, entry: Dict[str, Any]) -> "TraceCase":
         """Creates a TraceCase instance from a raw trace entry dictionary."""
-        self_data = entry.get("self") or {}
-        return cls(
-            args=tuple(entry.get("args", ())),
-            kwargs=dict(entry.get("kwargs") or {}),
-            expected=entry.get("result"),
-            self_type=self_data.get("type"),
-            self_state=self_data.get("state_before"),
-            obj_args=entry.get("obj_args") if isinstance(entry.get("obj_args"), dict) else None,
-            result_spec=entry.get("result_obj") if isinstance(entry.get("result_obj"), dict) else None,
-        )
+        return cls(*_fields_from_entry(entry))
+
+
+# Shared stand-in for a missing `self` block (read-only, never mutated).
+_EMPTY: Dict[str, Any] = {}
+
+
+def _fields_from_entry(entry: Dict[str, Any]) -> tuple:
+    """Extracts the `TraceCase` fields, in declaration order, from a raw entry."""
+    # One lookup per key; traces only carry plain dicts, hence `type(...) is dict`.
+    get = entry.get
+    self_data = get("self") or _EMPTY
+    self_type = self_data.get("type")
+    if type(self_type) is str:
+        self_type = sys.intern(self_type)
+    obj_args = get("obj_args")
+    if type(obj_args) is not dict:
+        obj_args = None
+    result_obj = get("result_obj")
+    if type(result_obj) is not dict:
+        result_obj = None
+    return (
+        tuple(get("args", ())),
+        dict(get("kwargs") or _EMPTY),
+        get("result"),
+        self_type,
+        self_data.get("state_before"),
+        obj_args,
+        result_obj,
+    )
+
+
+def _key_from_fields(
+    args, kwargs, expected, self_type, self_state, obj_args, result_spec
+) -> tuple:
+    """The `TraceCase` dedup key, computable before building the case itself."""
+    return (
+        _to_hashable(args),
+        _to_hashable(kwargs),
+        _to_hashable(expected),
+        self_type,
+        _to_hashable(self_state),
+        _to_hashable(obj_args),
+        _to_hashable(result_spec),
+    )
 
 
 def unique_cases(entries: Iterable[Dict[str, Any]]) -> List[TraceCase]:
@@ -125,25 +169,44 @@ def unique_cases(entries: Iterable[Dict[str, Any]]) -> List[TraceCase]:
         rendering the test file. This ensures that if a function was called 100
         times with the same inputs and gave the same output, only one test is generated.
     """
-    # Using a dict as an ordered set for efficient deduplication.
-    cases = list({TraceCase.from_entry(e): None for e in entries}.keys())
-    
-    # A sanity check to catch any unhashable types that _to_hashable might have missed.
-    for case in cases:
+    seen: set = set()
+    cases: List[TraceCase] = []
+    for e in entries:
+        fields = _fields_from_entry(e)
+        key = _key_from_fields(*fields)
+        # Cheap membership test first: duplicates never become a TraceCase.
         try:
-            hash(case)
-        except TypeError as e:
+            if key in seen:
+                continue
+            seen.add(key)
+        except TypeError as exc:
             raise TypeError(
                 f"Failed to hash a TraceCase. This likely means its '_key' "
                 f"contains an unhashable type that _to_hashable missed.\n"
-                f"Offending case args: {case.args!r}\n"
-                f"Offending case expected: {case.expected!r}\n"
-                f"Original error: {e}"
-            ) from e
-            
+                f"Offending case args: {fields[0]!r}\n"
+                f"Offending case expected: {fields[2]!r}\n"
+                f"Original error: {exc}"
+            ) from exc
+        case = TraceCase(*fields)
+        # The key is already known; spare the case from recomputing it.
+        object.__setattr__(case, "_key", key)
+        cases.append(case)
     return cases
 
 
+def count_unique_cases(entries: Iterable[Dict[str, Any]]) -> int:
+    """
+    What it does:
+        Returns `len(unique_cases(entries))` without building any `TraceCase`:
+        only the dedup keys are kept.
+
+    Its role in the library:
+        Used by the CLI summary (`unique_count`), which needs the number of
+        distinct cases but never renders them.
+    """
+    return len({_key_from_fields(*_fields_from_entry(e)) for e in entries})
+
+
 def pformat(obj: Any, width: int = _WRAP_WIDTH, sort_dicts: bool = True) -> str:
     """
     What it does:
@@ -154,10 +217,77 @@ def pformat(obj: Any, width: int = _WRAP_WIDTH, sort_dicts: bool = True) -> str:
         A formatting helper used by `render_case` to ensure that data structures
         are pretty-printed in the generated test code, improving readability.
     """
+    if width == _WRAP_WIDTH:
+        pp_sort, pp_nosort = _PP_SORT, _PP_NOSORT
+    else:
+        pp_sort = pprint.PrettyPrinter(width=width, compact=False, sort_dicts=True)
+        pp_nosort = pprint.PrettyPrinter(width=width, compact=False, sort_dicts=False)
     try:
-        return pprint.pformat(obj, width=width, compact=False, sort_dicts=sort_dicts)
+        return (pp_sort if sort_dicts else pp_nosort).pformat(obj)
     except TypeError:
-        return pprint.pformat(obj, width=width, compact=False)
+        return pp_nosort.pformat(obj)
+
+
+# Memo for `_pformat_cached`, bounded and emptied by `clear_pformat_cache`.
+_PFORMAT_CACHE: Dict[Any, str] = {}
+_PFORMAT_CACHE_MAX = 4096
+_PFORMAT_SCALARS = frozenset({str, int, bool, bytes, type(None)})
+
+
+def _pformat_key(obj: Any) -> Any:
+    """
+    Type-exact hashable key for `obj`, or None when it can't be keyed safely.
+
+    `_to_hashable` is not enough here: 1, 1.0 and True (or a list and a tuple)
+    hash equal but render differently, so every level records its exact type.
+    """
+    t = type(obj)
+    if t in _PFORMAT_SCALARS:
+        return (t, obj)
+    if t is float:
+        return (t, repr(obj))  # keeps -0.0 / 0.0 apart
+    if t is tuple or t is list:
+        items = []
+        for v in obj:
+            k = _pformat_key(v)
+            if k is None:
+                return None
+            items.append(k)
+        return (t, tuple(items))
+    if t is dict:
+        # pprint sorts dict items, so insertion order doesn't change the output.
+        pairs = []
+        for k, v in obj.items():
+            kk, vk = _pformat_key(k), _pformat_key(v)
+            if kk is None or vk is None:
+                return None
+            pairs.append((kk, vk))
+        return (t, frozenset(pairs))
+    return None
+
+
+def _pformat_cached(obj: Any) -> str:
+    """`pformat` memoized on the value of `obj` (traces repeat small values a lot)."""
+    key = _pformat_key(obj)
+    if key is None:
+        return pformat(obj)
+    text = _PFORMAT_CACHE.get(key)
+    if text is None:
+        if len(_PFORMAT_CACHE) >= _PFORMAT_CACHE_MAX:
+            _PFORMAT_CACHE.clear()
+        text = _PFORMAT_CACHE[key] = pformat(obj)
+    return text
+
+
+def clear_pformat_cache() -> None:
+    """Drops the `render_case` formatting memo (call once a module is rendered)."""
+    _PFORMAT_CACHE.clear()
+
+
+# Field values in the order of a rendered case tuple (see testkit's `Case`).
+_case_fields = operator.attrgetter(
+    "args", "kwargs", "expected", "self_type", "self_state", "obj_args", "result_spec"
+)
 
 
 def render_case(case: TraceCase, base_indent: int = 8) -> List[str]:
@@ -173,18 +303,61 @@ def render_case(case: TraceCase, base_indent: int = 8) -> List[str]:
     """
     indent_item = " " * base_indent
     indent_body = " " * (base_indent + 4)
-    
-    body = (
-        f"{pformat(case.args)},\n"
-        f"{pformat(case.kwargs)},\n"
-        f"{pformat(case.expected)},\n"
-        f"{pformat(case.self_type)},\n"
-        f"{pformat(case.self_state)},\n"
-        f"{pformat(case.obj_args)},\n"
-        f"{pformat(case.result_spec)},"
-    )
-    
-    return [f"{indent_item}(", textwrap.indent(body, indent_body), f"{indent_item}),"]
+    # Uniform indent and no blank lines (pformat never emits one): joining on
+    # "\n" + indent does what textwrap.indent would, minus its per-line regex.
+    pad = "\n" + indent_body
+    body = ",\n".join(map(_pformat_cached, _case_fields(case))).replace("\n", pad)
+    return [f"{indent_item}(", f"{indent_body}{body},", f"{indent_item}),"]
+
+
+def _bounded_repr(obj: Any, limit: int) -> str:
+    """
+    `repr(obj)`, except that rendering may stop once more than `limit` characters
+    have been produced. The result is always a prefix of the real repr, so
+    clipping it to `limit` gives exactly what clipping `repr(obj)` would give.
+
+    Plain tuples, lists and dicts are rendered piece by piece (mirroring the
+    builtin reprs, recursion markers included); anything else goes to `repr`.
+    """
+    out: List[str] = []
+    size = 0
+    active: set = set()
+
+    def emit(text: str) -> bool:
+        nonlocal size
+        out.append(text)
+        size += len(text)
+        return size > limit
+
+    def walk(o: Any) -> bool:  # True once the budget is exhausted
+        t = type(o)
+        if t is not tuple and t is not list and t is not dict:
+            return emit(repr(o))
+        opening, closing = ("(", ")") if t is tuple else ("[", "]") if t is list else ("{", "}")
+        if id(o) in active:
+            return emit(opening + "..." + closing)
+        if not o:
+            return emit(opening + closing)
+        active.add(id(o))
+        try:
+            if emit(opening):
+                return True
+            if t is dict:
+                for i, (k, v) in enumerate(o.items()):
+                    if (i and emit(", ")) or walk(k) or emit(": ") or walk(v):
+                        return True
+            else:
+                for i, v in enumerate(o):
+                    if (i and emit(", ")) or walk(v):
+                        return True
+            if t is tuple and len(o) == 1 and emit(","):
+                return True
+            return emit(closing)
+        finally:
+            active.discard(id(o))
+
+    walk(obj)
+    return "".join(out)
 
 
 def case_id(args: tuple, kwargs: dict, maxlen: int = 80) -> str:
@@ -198,5 +371,8 @@ def case_id(args: tuple, kwargs: dict, maxlen: int = 80) -> str:
         appear in pytest's output (e.g., `... PASSED tests/test_mymodule.py::test_add[2-3]`).
         It's passed to the `ids` argument of `@pytest.mark.parametrize`.
     """
-    base = repr(args) if not kwargs else f"{repr(args)} {repr(kwargs)}"
+    # Only ~maxlen characters survive, so big payloads are never fully repr'd.
+    base = _bounded_repr(args, maxlen)
+    if kwargs and len(base) <= maxlen:
+        base = f"{base} {_bounded_repr(kwargs, maxlen)}"
     return base if len(base) <= maxlen else base[: maxlen - 3] + "..."
@@ -1,10 +1,16 @@
 
 from __future__ import annotations
+import os
+import stat
+import sys as _sys
+from hashlib import blake2b
 from pathlib import Path
 from typing import Any, Dict, Iterable, List, Tuple, Optional, Callable
 
 from .config_cli import diagnostics_for_storage_dir, resolve_under_project_root
-from .config_cli import load_layered_config, apply_effective_to_args
+from .config_cli import load_layered_config, apply_effective_to_args, effective_sections
+from .config_cli import is_emptyish as emptyish
+from .config_cli import resolve_path
 
 
 
@@ -27,25 +33,53 @@ __all__ = [
 
 
     
+def _emit_canonical(x: Any, out: Callable[[str], Any]) -> None:
+    """
+    Emit a canonical encoding of a JSON-like value as str pieces to `out`
+    (typically list.append): dict keys sorted, lists/tuples in order, scalars
+    tagged by type and length-prefixed so that distinct values never share
+    an encoding.
+    """
+    t = type(x)
+    if t is dict:
+        out("{")
+        for k in sorted(x):
+            _emit_canonical(k, out)
+            _emit_canonical(x[k], out)
+        out("}")
+    elif t is list or t is tuple:
+        out("[")
+        for v in x:
+            _emit_canonical(v, out)
+        out("]")
+    else:
+        r = x if t is str else repr(x)
+        out(f"{t.__name__}{len(r)}:{r}")
+
+
 def unique_count(entries_by_func):
     """
     Count unique cases.
-    - graph-json: uniqueness by JSON value of (args_graph, kwargs_graph, result_graph)
+    - graph-json: uniqueness by value of (args_graph, kwargs_graph, result_graph)
     - pickle (legacy state-based): reuse TraceCase hashing
     """
-    import json
     total = 0
     for entries in entries_by_func.values():
         if entries and ("args_graph" not in entries[0]):
-            from .._cases import unique_cases  # lazy import
-            total += len(unique_cases(entries))
+            from .._cases import count_unique_cases  # lazy import
+            total += count_unique_cases(entries)
             continue
-        def _norm(x):  # graph-json
-            return json.dumps(x, sort_keys=True, ensure_ascii=False)
-        seen = {
-            (_norm(e.get("args_graph")), _norm(e.get("kwargs_graph")), _norm(e.get("result_graph")))
-            for e in entries
-        }
+        # graph-json: keep a 16-byte digest of the canonical triple per entry
+        # instead of the values themselves (keys are str after JSON decode, so
+        # they always sort). The whole triple is encoded in one traversal,
+        # joined and encoded once, hashed once.
+        seen = set()
+        for e in entries:
+            parts = (e.get("args_graph"), e.get("kwargs_graph"), e.get("result_graph"))
+            pieces: List[str] = []
+            _emit_canonical(parts, pieces.append)
+            blob = "".join(pieces).encode("utf-8", "surrogatepass")
+            seen.add(blake2b(blob, digest_size=16).digest())
         total += len(seen) if seen else len(entries)
     return total
 
@@ -84,16 +118,13 @@ def fallback_targets_from_cfg(
             label,
             cfg_targets,
         )
-        return list(cfg_targets)
+        return list(dict.fromkeys(cfg_targets))
     return targets
-    
-    
-
-def emptyish(x) -> bool:
-    """None, '' , [], {} → True (utile pour args de CLI / config)."""
-    return x is None or (isinstance(x, (str, list, dict)) and len(x) == 0)
 
 
+def _is_py_token(tok: object) -> bool:
+    """True for a str token naming a .py file (argparse tokens are exact str)."""
+    return type(tok) is str and tok.endswith(".py")
 
 
 def require_script_py_or_exit(cmd: List[str], logger: Any) -> Path:
@@ -103,13 +134,13 @@ def require_script_py_or_exit(cmd: List[str], logger: Any) -> Path:
     """
     if not cmd:
         logger.error("No script specified after '--'")
-        import sys as _sys
         _sys.exit(1)
     script = cmd[0]
-    if not isinstance(script, str) or not script.endswith(".py"):
+    if not _is_py_token(script):
         logger.error("Unsupported script '%s': only .py files are allowed", script)
-        import sys as _sys
         _sys.exit(1)
+    # realpath (pas abspath) : lancé via un lien, le dossier du *vrai* script
+    # passe en tête de sys.path, comme avec `python lien.py`.
     try:
         return Path(script).resolve()
     except Exception:
@@ -135,13 +166,12 @@ def ensure_storage_dir_or_exit(ctx, section: str, storage_dir_value: Optional[Pa
     Valide l'option storage_dir (présence + existence répertoire). Loggue diagnostics
     enrichis (y compris rapport de config) et exit(1) en cas d'erreur. Retourne le Path.
     """
-    import sys as _sys
     if emptyish(storage_dir_value):
         logger.error(
             "%s: missing 'storage_dir'. Ensure it exists in [defaults] or [%s], "
             "or pass --storage-dir. Config used: %s",
             section.upper(), section,
-            str(getattr(ctx, "source_path", None)) if getattr(ctx, "source_path", None) else "<none>",
+            str(getattr(ctx, "source_path", None) or "<none>"),
         )
         try:
             diag = diagnostics_for_storage_dir(ctx, section, storage_dir_value)
@@ -151,7 +181,11 @@ def ensure_storage_dir_or_exit(ctx, section: str, storage_dir_value: Optional[Pa
         _sys.exit(1)
 
     p = resolve_under_project_root(ctx, storage_dir_value)
-    if not p.exists() or not p.is_dir():
+    try:
+        is_dir = stat.S_ISDIR(os.stat(p).st_mode)
+    except OSError:
+        is_dir = False
+    if not is_dir:
         logger.error("Storage (calls) directory '%s' does not exist or is not a directory", p)
         try:
             diag = diagnostics_for_storage_dir(ctx, section, p)
@@ -170,13 +204,17 @@ def resolve_additional_sys_path(project_root: Path, raw_paths: Iterable[str]) ->
     """
     out: List[str] = []
     seen: set[str] = set()
+    raw_seen: set = set()  # tokens déjà traités: pas besoin de les re-normaliser
     for p in raw_paths or []:
-        pp = Path(p)
-        ap = pp if pp.is_absolute() else (project_root / pp)
+        if p in raw_seen:
+            continue
+        raw_seen.add(p)
+        fp = os.fspath(p)
+        ap = fp if os.path.isabs(fp) else os.path.join(project_root, fp)
         try:
-            s = str(ap.resolve())
+            s = str(resolve_path(ap))
         except Exception:
-            s = str(ap)
+            s = os.path.abspath(ap)
         if s not in seen:
             seen.add(s)
             out.append(s)
@@ -211,10 +249,9 @@ def require_output_dir_or_exit(ctx, out_dir_value: Optional[Path | str], logger,
 
 def extract_script_and_argv(remainder: list[str], logger) -> Tuple[Path, list[str]]:
     """Strip leading '--', validate .py, and return (script_path, argv)."""
-    cmd = list(remainder or [])
-    if cmd and cmd[0] == "--":
-        cmd = cmd[1:]
-    from ._cli_utils import require_script_py_or_exit  # self-import ok
+    remainder = remainder or []
+    # Single copy: the returned argv must not alias argparse's REMAINDER list.
+    cmd = remainder[1:] if remainder and remainder[0] == "--" else list(remainder)
     script_path = require_script_py_or_exit(cmd, logger)
     return script_path, cmd  # cmd includes script + its args; run_script sets sys.argv
 
@@ -236,20 +273,22 @@ def normalize_additional_sys_path(project_root: Path, raw_paths: Iterable[str] |
       - Always include project_root first.
       - Then resolve each additional path (relative under project_root or absolute).
       - Return absolute strings, deduped with order preserved.
+
+    `project_root` is expected to be already resolved (ConfigContext.project_root
+    always is). Relative entries are joined under it and resolved like absolute
+    ones (memoized realpath), so one directory reached both ways is kept once.
     """
-    pr = str(project_root.resolve())
+    pr = str(project_root)
     roots: list[str] = [pr]
 
     seen = {pr}
+    raw_seen: set = set()  # repeated raw tokens (tead inheriting run's roots) skip resolve()
     for raw in raw_paths or []:
-        if not raw:
+        if not raw or raw in raw_seen:
             continue
-        p = Path(raw)
-        if not p.is_absolute():
-            p = (project_root / p).resolve()
-        else:
-            p = p.resolve()
-        s = str(p)
+        raw_seen.add(raw)
+        fp = os.fspath(raw)
+        s = str(resolve_path(fp if os.path.isabs(fp) else os.path.join(pr, fp)))
         if s not in seen:
             seen.add(s)
             roots.append(s)
@@ -262,18 +301,20 @@ def load_ctx_and_fill(section: str, args, start_getter: Callable[[object], Optio
     apply_effective_to_args(section, ctx, args)
     
     # Fallbacks: when section == "tead", inherit missing keys from "run"
-    if section == "tead":
+    # (no section lookup at all when the CLI/[tead] already provided them).
+    missing = (
+        [k for k in ("additional_sys_path", "targets") if getattr(args, k, None) in (None, [], ())]
+        if section == "tead" else []
+    )
+    if missing:
         try:
-            from ._common import eff
-            eff_tead = eff(ctx, "tead")
-            eff_run  = eff(ctx, "run")
-            for key in ("additional_sys_path", "targets"):
-                if getattr(args, key, None) in (None, [], ()):
-                    val = eff_tead.get(key)
-                    if not val:
-                        val = eff_run.get(key)
-                    if val:
-                        setattr(args, key, val)
+            eff = effective_sections(ctx, "tead", "run")
+            for key in missing:
+                val = eff["tead"].get(key)
+                if not val:
+                    val = eff["run"].get(key)
+                if val:
+                    setattr(args, key, val)
         except Exception:
             # Soft-fail: if eff or ctx layout changes, don't break the CLI
             pass
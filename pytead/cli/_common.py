@@ -5,15 +5,10 @@ from pathlib import Path
 from typing import Iterable, List, Optional, Sequence, Dict, Any
 
 from ..logconf import configure_logger
-from .config_cli import effective_section
-from ._cli_utils import (
-    load_ctx_and_fill,
-    ensure_storage_dir_or_exit,
-    resolve_storage_dir_for_write,
-    require_output_dir_or_exit,
-    normalize_additional_sys_path,
-    fallback_targets_from_cfg,
-)
+
+# The add_opt_* helpers below only need argparse: subcommand modules import this
+# one to register their parser, so the config layer (config_cli, _cli_utils) is
+# imported by the handler-side helpers when a command actually runs.
 
 FORMAT_CHOICES = ("pickle", "graph-json")
 
@@ -22,27 +17,37 @@ def make_logger(cmd: str):
 
 
 def load_ctx_anchored(section: str, args: argparse.Namespace, anchor: Path | str | None):
+    from ._cli_utils import load_ctx_and_fill
     return load_ctx_and_fill(section, args, lambda _a: anchor)
 
 def eff(ctx, section: str) -> Dict[str, Any]:
+    from .config_cli import effective_section
     return effective_section(ctx, section) or {}
 
+def effs(ctx, *sections: str) -> Dict[str, Dict[str, Any]]:
+    from .config_cli import effective_sections
+    return effective_sections(ctx, *sections)
+
 def norm_roots(project_root: Path, add_sys: Optional[Iterable[str] | Iterable[Path]]):
+    from ._cli_utils import normalize_additional_sys_path
     abs_strs = normalize_additional_sys_path(project_root, add_sys)
     path_list = [Path(p) for p in (abs_strs or [])]
     return abs_strs or None, path_list
 
 
 def storage_for_read(ctx, arg_value, log, section: str) -> Path:
+    from ._cli_utils import ensure_storage_dir_or_exit
     return ensure_storage_dir_or_exit(ctx, section, arg_value, log)
 
 def storage_for_write(ctx, arg_value, log) -> Path:
+    from ._cli_utils import resolve_storage_dir_for_write
     return resolve_storage_dir_for_write(ctx, arg_value, log)
 
 def pick_output_dir(ctx, arg_value, sections: Sequence[Dict[str, Any]], log, *, section: str) -> Path:
     """
     Minimal policy: prefer the explicit arg if given, else the first section that specifies output_dir/out_dir.
     """
+    from ._cli_utils import require_output_dir_or_exit
     if arg_value is not None:
         return require_output_dir_or_exit(ctx, arg_value, log, section=section)
     for s in sections:
@@ -55,30 +60,36 @@ def pick_output_dir(ctx, arg_value, sections: Sequence[Dict[str, Any]], log, *,
 
 def compute_targets(cli_targets: Sequence[str] | None, sections: Sequence[Dict[str, Any]], log, label: str) -> List[str]:
     """
-    Minimal fallback: take CLI if present, otherwise first section that yields non-empty via fallback_targets_from_cfg.
+    Minimal fallback: take CLI if present, otherwise the first section with non-empty `targets`.
     """
-    targets = list(cli_targets or [])
+    targets = list(dict.fromkeys(cli_targets or []))
     if targets:
         return targets
     for s in sections:
-        targets = fallback_targets_from_cfg([], s, log, label)
-        if targets:
-            return targets
+        cfg_targets = s.get("targets") if s else None
+        if cfg_targets:
+            log.info("%s: no CLI targets after split; falling back to config targets: %s", label, cfg_targets)
+            return list(dict.fromkeys(cfg_targets))
     return []
     
+def add_opt_limit(p: argparse.ArgumentParser):
+    return p.add_argument("--limit", type=int, default=argparse.SUPPRESS,
+                          help="max number of calls to capture per target (default from config)")
+
 def add_opt_format(p: argparse.ArgumentParser):
     return p.add_argument("--format", choices=FORMAT_CHOICES, default=argparse.SUPPRESS)
 
 def add_opt_formats(p: argparse.ArgumentParser):
     return p.add_argument("--formats", choices=FORMAT_CHOICES, nargs="*", default=argparse.SUPPRESS)
 
-def add_opt_storage_dir(p: argparse.ArgumentParser, *, for_read: bool):
-    h = "directory containing traces (read)" if for_read else "directory where traces will be written"
-    return p.add_argument("-s", "--storage-dir", type=Path, default=argparse.SUPPRESS, help=h)
+def add_opt_storage_dir(p: argparse.ArgumentParser, *, for_read: bool, help: Optional[str] = None):
+    if help is None:
+        help = "directory containing traces (read)" if for_read else "directory where traces will be written"
+    return p.add_argument("-s", "--storage-dir", type=Path, default=argparse.SUPPRESS, help=help)
 
-def add_opt_output_dir(p: argparse.ArgumentParser):
+def add_opt_output_dir(p: argparse.ArgumentParser, *, help: str = "directory where outputs will be written"):
     return p.add_argument("-d", "--output-dir", dest="output_dir", type=Path, default=argparse.SUPPRESS,
-                          help="directory where outputs will be written")
+                          help=help)
 
 def add_opt_additional_sys_path(p: argparse.ArgumentParser):
     return p.add_argument("--additional-sys-path", dest="additional_sys_path", nargs="*", default=argparse.SUPPRESS,
@@ -5,7 +5,6 @@ import argparse
 from pathlib import Path
 from typing import Optional
 
-from . import service_cli as svc
 from ._common import (
     make_logger,
     load_ctx_anchored,
@@ -29,10 +28,12 @@ def _handle(args: argparse.Namespace) -> None:
     storage_dir: Path = storage_for_read(ctx, getattr(args, "storage_dir", None), log, "gen")
     output_dir: Path = pick_output_dir(ctx, getattr(args, "output_dir", None), [eff_gen], log, section="gen")
 
-    project_root = Path(ctx.project_root)
+    project_root: Path = ctx.project_root
     abs_roots, _paths = norm_roots(project_root, getattr(args, "additional_sys_path", None))
     import_roots: Optional[list[str]] = abs_roots
 
+    from . import service_cli as svc  # lazy: only `gen` needs the service layer
+
     svc.collect_and_emit_tests(
         storage_dir=storage_dir,
         formats=list(getattr(args, "formats", []) or []),
@@ -5,8 +5,6 @@ import argparse
 from pathlib import Path
 from typing import List
 
-from . import service_cli as svc
-from ._cli_utils import extract_script_and_argv
 from ._common import (
     make_logger,
     load_ctx_anchored,
@@ -14,6 +12,7 @@ from ._common import (
     norm_roots,
     storage_for_write,
     compute_targets,
+    add_opt_limit,
     add_opt_storage_dir,
     add_opt_format,
     add_opt_additional_sys_path,
@@ -23,10 +22,12 @@ from ._common import (
 
 
 def _handle(args: argparse.Namespace) -> None:
+    from ._cli_utils import extract_script_and_argv
+
     log = make_logger("run")
 
     # 1) Script + argv (supports the `--` sentinel)
-    script_path, argv = extract_script_and_argv(list(getattr(args, "cmd", []) or []), log)
+    script_path, argv = extract_script_and_argv(getattr(args, "cmd", None), log)
 
     # 2) Load layered config anchored on the script location; hydrate [run] into args
     ctx = load_ctx_anchored("run", args, script_path)
@@ -42,10 +43,12 @@ def _handle(args: argparse.Namespace) -> None:
     storage_dir: Path = storage_for_write(ctx, getattr(args, "storage_dir", None), log)
 
     # 5) Additional import roots (absolute); service expects Paths here
-    project_root = Path(ctx.project_root)
+    project_root: Path = ctx.project_root
     _abs_roots, add_paths = norm_roots(project_root, getattr(args, "additional_sys_path", None))
 
     # 6) Orchestrate: instrument → run (no exit-code mapping, let exceptions bubble)
+    from . import service_cli as svc  # lazy: keeps parser registration cheap
+
     svc.instrument_and_run(
         targets=targets,
         limit=getattr(args, "limit", None),
@@ -62,13 +65,7 @@ def _handle(args: argparse.Namespace) -> None:
 def add_run_subparser(subparsers: argparse._SubParsersAction) -> None:
     p = subparsers.add_parser("run", help="instrument targets then run a Python script")
 
-    p.add_argument(
-        "--limit",
-        type=int,
-        default=argparse.SUPPRESS,
-        help="max number of calls to capture per target (default from config)",
-    )
-
+    add_opt_limit(p)
     add_opt_storage_dir(p, for_read=False)
     add_opt_format(p)
     add_opt_additional_sys_path(p)
@@ -2,24 +2,24 @@
 from __future__ import annotations
 
 import argparse
-import sys
 from pathlib import Path
 from typing import Optional
 
 from ..errors import PyteadError
-from ..logconf import configure_logger
-from .config_cli import effective_section
-from . import service_cli as svc  # keep your existing service entrypoints
-from ._cli_utils import (
-    load_ctx_and_fill,
-    ensure_storage_dir_or_exit,
-    require_output_dir_or_exit,
-    normalize_additional_sys_path,
-)
+from . import _common
 
 
 def _handle(args: argparse.Namespace) -> None:
-    log = configure_logger(name="pytead.cli.types")
+    # Config layer imported here only: registering the subparser needs argparse alone.
+    from .config_cli import effective_section
+    from ._cli_utils import (
+        load_ctx_and_fill,
+        ensure_storage_dir_or_exit,
+        require_output_dir_or_exit,
+        normalize_additional_sys_path,
+    )
+
+    log = _common.make_logger("types")
 
     # 1) Load layered config; anchor on storage_dir or output_dir if provided
     ctx = load_ctx_and_fill(
@@ -27,8 +27,8 @@ def _handle(args: argparse.Namespace) -> None:
         args,
         lambda a: getattr(a, "storage_dir", None) or getattr(a, "output_dir", None),
     )
-    eff_types = effective_section(ctx, "types") or {}
-    project_root = Path(ctx.project_root)
+    eff_types = effective_section(ctx, "types")
+    project_root: Path = ctx.project_root
 
     # 2) Resolve and validate the input directory (traces)
     storage_dir: Path = ensure_storage_dir_or_exit(ctx, "types", getattr(args, "storage_dir", None), log)
@@ -49,6 +49,7 @@ def _handle(args: argparse.Namespace) -> None:
         # If you already have a dedicated function for stub generation, call it here.
         # Example (adjust to your actual service API):
         #
+        # from . import service_cli as svc  # lazy: keep `pytead -h` cheap
         # svc.collect_and_emit_type_stubs(
         #     storage_dir=storage_dir,
         #     formats=getattr(args, "formats", None),  # typically ["pickle"]
@@ -66,23 +67,12 @@ def add_types_subparser(subparsers: argparse._SubParsersAction) -> None:
     """Register the `types` subcommand."""
     p = subparsers.add_parser("types", help="generate .pyi type stubs from traces")
 
-    # Input (traces)
-    p.add_argument(
-        "-s",
-        "--storage-dir",
-        type=Path,
-        default=argparse.SUPPRESS,
-        help="directory containing recorded traces (defaults via layered config)",
+    # Input (traces) / output (.pyi destination): same options as gen/tead
+    _common.add_opt_storage_dir(
+        p, for_read=True, help="directory containing recorded traces (defaults via layered config)"
     )
-
-    # Output (.pyi destination)
-    p.add_argument(
-        "-d",
-        "--output-dir",
-        dest="output_dir",
-        type=Path,
-        default=argparse.SUPPRESS,
-        help="write stub files (.pyi) under this directory (required via CLI or config)",
+    _common.add_opt_output_dir(
+        p, help="write stub files (.pyi) under this directory (required via CLI or config)"
     )
 
     # Restrict input formats (only 'pickle' is supported here)
@@ -95,13 +85,7 @@ def add_types_subparser(subparsers: argparse._SubParsersAction) -> None:
     )
 
     # Additional import roots (same policy as run/gen/tead)
-    p.add_argument(
-        "--additional-sys-path",
-        dest="additional_sys_path",
-        nargs="*",
-        default=argparse.SUPPRESS,
-        help="extra import roots; relative paths are resolved under the project root",
-    )
+    _common.add_opt_additional_sys_path(p)
 
     p.set_defaults(handler=_handle)
 
@@ -2,9 +2,12 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, Optional, List
+from typing import Any, Dict, Optional, List, Sequence
 import os
+import stat
+import sys
 import logging
 import hashlib
 import importlib.resources as ir
@@ -16,11 +19,22 @@ _log = logging.getLogger("pytead.cli.config")
 
 _DEBUG_EVENTS: List[Dict[str, Any]] = []
 
+# Capture activée ? Réévalué à chaque `load_layered_config` : PYTEAD_CONFIG_DEBUG
+# non vide, ou logger "pytead.cli.config" en DEBUG. Sinon `_dbg` ne fait rien
+# et les détails coûteux (sha256, aperçu masqué, listes de candidats) ne sont
+# même pas calculés.
+_DEBUG_ENABLED = False
+
+def _config_debug_enabled() -> bool:
+    return bool(os.environ.get("PYTEAD_CONFIG_DEBUG")) or _log.isEnabledFor(logging.DEBUG)
+
 def _dbg(kind: str, **details: Any) -> None:
     """
     Empile un événement structuré (non loggé tout de suite) pour pouvoir
     reconstruire un rapport détaillé *au moment où* on en a besoin.
     """
+    if not _DEBUG_ENABLED:
+        return
     try:
         _DEBUG_EVENTS.append({"kind": kind, **details})
     except Exception:
@@ -28,6 +42,9 @@ def _dbg(kind: str, **details: Any) -> None:
         pass
 
 _SECRET_KEY_RE = re.compile(r"(?i)\b(token|secret|password|passwd|apikey|api_key|auth|key)\b")
+# Sous-chaînes couvrant toutes les alternatives de la regex : une ligne qui n'en
+# contient aucune (le cas courant) est écartée sans passer par le moteur regex.
+_SECRET_HINTS = ("token", "secret", "pass", "key", "auth")
 
 def _redact_preview(s: str, max_chars: int = 1200) -> str:
     """
@@ -36,7 +53,8 @@ def _redact_preview(s: str, max_chars: int = 1200) -> str:
     s = s[:max_chars]
     out = []
     for line in s.splitlines():
-        if _SECRET_KEY_RE.search(line):
+        low = line.casefold()
+        if any(h in low for h in _SECRET_HINTS) and _SECRET_KEY_RE.search(line):
             if "=" in line:
                 k, _ = line.split("=", 1)
                 line = f"{k}= ***REDACTED***"
@@ -60,35 +78,93 @@ def _sha256_bytes(b: bytes) -> str:
 class ConfigContext:
     """In-memory representation of the layered configuration."""
     raw: Dict[str, Any]               # full layered mapping with sections (defaults/run/...)
-    project_root: Path                # resolved project root (if any), else CWD
+    project_root: Path                # project root, already resolved (if any), else CWD
     source_path: Optional[Path]       # project-level config file path, if found (else None)
     debug: List[Dict[str, Any]] = field(default_factory=list)  # événements capturés
+    user_source_path: Optional[Path] = None  # user-level config file merged (if any)
+    # Sections effectives déjà calculées (defaults <- section, coercées), par nom.
+    _effective_cache: Dict[str, Dict[str, Any]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
 
 # ---------- File discovery ----------
 
-def _first_existing(paths: list[Path]) -> Optional[Path]:
-    for p in paths:
-        if p.is_file():
-            return p
-    return None
+def _dir_files(d: Path, wanted: set) -> set:
+    """Names in `wanted` that are files in `d` (one scandir; raises OSError if `d` can't be listed)."""
+    with os.scandir(d) as it:
+        # DirEntry.is_file() reuses d_type (only symlinks need a stat).
+        return {e.name for e in it if e.name in wanted and e.is_file()}
+
+def _first_existing(paths: Sequence[Path]) -> Optional[Path]:
+    """
+    First of `paths` that is a file. Candidates live in one directory
+    (config.toml/.yaml/.yml): it is listed once with scandir instead of one
+    stat per candidate, and a missing directory costs a single failed call.
+    """
+    if not paths:
+        return None
+    d = paths[0].parent
+    if any(p.parent != d for p in paths):
+        return next((p for p in paths if p.is_file()), None)
+    try:
+        present = _dir_files(d, {p.name for p in paths})
+    except OSError:
+        return None
+    return next((p for p in paths if p.name in present), None)
+
+_PROJECT_CFG_NAMES = ("config.toml", "config.yaml", "config.yml")
 
 def _find_project_config(start: Path) -> Optional[Path]:
     """
     Return nearest '.pytead/config.{toml,yaml,yml}' walking upward from 'start'.
     """
-    cur = start.resolve()
+    return _find_project_config_and_root(start)[0]
+
+def _find_project_config_and_root(start: Path) -> tuple[Optional[Path], Optional[Path]]:
+    """
+    Same walk as `_find_project_config`, also returning the directory holding
+    the '.pytead' that matched (the project root), or (None, None).
+    """
+    cur = resolve_path(start)
     _dbg("project_search_start", start=str(cur))
+    wanted = set(_PROJECT_CFG_NAMES)
     for p in [cur, *cur.parents]:
         base = p / ".pytead"
-        cands = [base / "config.toml", base / "config.yaml", base / "config.yml"]
-        _dbg("project_search_try", dir=str(p), candidates=[str(x) for x in cands])
-        cand = _first_existing(cands)
+        cands = [base / n for n in _PROJECT_CFG_NAMES]
+        if _DEBUG_ENABLED:
+            _dbg("project_search_try", dir=str(p), candidates=[str(x) for x in cands])
+        try:
+            present = _dir_files(base, wanted)
+        except OSError:
+            continue
+        cand = next((c for c in cands if c.name in present), None)
         if cand:
             _dbg("project_config_found", path=str(cand))
             _log.info("project config: %s", cand)
-            return cand
+            return cand, p
     _dbg("project_config_not_found")
-    return None
+    return None, None
+
+@lru_cache(maxsize=8)
+def _user_candidate_groups(xdg_home: Optional[str], home_env: Optional[str]) -> tuple:
+    """
+    (événement debug, détails, message de log, candidats) pour les emplacements 2) à 4)
+    de `_find_user_config`. Ne dépend que de $XDG_CONFIG_HOME et $HOME : les
+    Path sont construits une fois par valeur, seuls les fichiers sont re-testés.
+    """
+    names = ("config.toml", "config.yaml", "config.yml")
+    home = Path.home()
+    groups = []
+    if xdg_home:
+        base = Path(xdg_home) / "pytead"
+        groups.append(("user_xdg_candidates", {"base": xdg_home}, "user config via XDG: %s",
+                       tuple(base / n for n in names)))
+    for event, base in (
+        ("user_home_candidates", home / ".config" / "pytead"),
+        ("user_legacy_candidates", home / ".pytead"),
+    ):
+        groups.append((event, {}, "user config: %s", tuple(base / n for n in names)))
+    return tuple(groups)
 
 def _find_user_config() -> Optional[Path]:
     """
@@ -101,102 +177,88 @@ def _find_user_config() -> Optional[Path]:
     env_path = os.getenv("PYTEAD_CONFIG")
     if env_path:
         env_cand = Path(env_path).expanduser()
-        _dbg("user_env_candidate", env="PYTEAD_CONFIG", value=env_path, exists=env_cand.is_file())
-        if env_cand.is_file():
+        env_ok = env_cand.is_file()
+        _dbg("user_env_candidate", env="PYTEAD_CONFIG", value=env_path, exists=env_ok)
+        if env_ok:
             _log.info("user config via PYTEAD_CONFIG=%s", env_cand)
             return env_cand
 
-    xdg_home = os.getenv("XDG_CONFIG_HOME")
-    if xdg_home:
-        paths = [
-            Path(xdg_home) / "pytead" / "config.toml",
-            Path(xdg_home) / "pytead" / "config.yaml",
-            Path(xdg_home) / "pytead" / "config.yml",
-        ]
-        _dbg("user_xdg_candidates", base=xdg_home, candidates=[str(x) for x in paths])
+    for event, extra, log_msg, paths in _user_candidate_groups(os.getenv("XDG_CONFIG_HOME"), os.getenv("HOME")):
+        if _DEBUG_ENABLED:
+            _dbg(event, **extra, candidates=[str(x) for x in paths])
         cand = _first_existing(paths)
         if cand:
-            _log.info("user config via XDG: %s", cand)
+            _log.info(log_msg, cand)
             return cand
 
-    paths = [
-        Path.home() / ".config" / "pytead" / "config.toml",
-        Path.home() / ".config" / "pytead" / "config.yaml",
-        Path.home() / ".config" / "pytead" / "config.yml",
-    ]
-    _dbg("user_home_candidates", candidates=[str(x) for x in paths])
-    cand = _first_existing(paths)
-    if cand:
-        _log.info("user config: %s", cand)
-        return cand
-
-    paths = [
-        Path.home() / ".pytead" / "config.toml",
-        Path.home() / ".pytead" / "config.yaml",
-        Path.home() / ".pytead" / "config.yml",
-    ]
-    _dbg("user_legacy_candidates", candidates=[str(x) for x in paths])
-    cand = _first_existing(paths)
-    if cand:
-        _log.info("user config: %s", cand)
-        return cand
-
     _dbg("user_config_not_found")
     return None
 
 # ---------- Parsers ----------
 
-def _load_toml_text(txt: str) -> Dict[str, Any]:
+@lru_cache(maxsize=None)
+def _toml_parsers() -> tuple:
     """
-    Essaie tomllib (3.11+), puis tomli (3.9/3.10), puis toml (si installé).
-    Trace chaque tentative (ok/erreur).
+    (nom, loads) des bibliothèques TOML importables, dans l'ordre de préférence :
+    tomllib (3.11+), tomli (3.9/3.10), toml (optionnel). Résolu une seule fois.
     """
+    found = []
     try:
         import tomllib  # Python >= 3.11
-        _dbg("toml_parser_try", lib="tomllib")
-        try:
-            out = tomllib.loads(txt)
-            _dbg("toml_parser_ok", lib="tomllib")
-            return out
-        except Exception as exc:
-            _dbg("toml_parser_fail", lib="tomllib", error=str(exc))
-            _log.warning("Failed to parse TOML with tomllib: %s", exc)
+        found.append(("tomllib", tomllib.loads))
     except ModuleNotFoundError:
-        _dbg("toml_lib_missing", lib="tomllib")
-
+        pass
     try:
         import tomli  # 3.9 / 3.10
-        _dbg("toml_parser_try", lib="tomli")
-        out = tomli.loads(txt)
-        _dbg("toml_parser_ok", lib="tomli")
-        return out
-    except Exception as exc:
-        _dbg("toml_parser_fail", lib="tomli", error=str(exc))
-        _log.warning("Failed to parse TOML with tomli: %s", exc)
-
+        found.append(("tomli", tomli.loads))
+    except ImportError:
+        pass
     try:
         import toml  # optionnel
-        _dbg("toml_parser_try", lib="toml")
-        out = toml.loads(txt)
-        _dbg("toml_parser_ok", lib="toml")
-        return out
-    except Exception as exc:
-        _dbg("toml_parser_fail", lib="toml", error=str(exc))
-        _log.warning("Failed to parse TOML with toml: %s", exc)
+        found.append(("toml", toml.loads))
+    except ImportError:
+        pass
+    return tuple(found)
+
+def _load_toml_text(txt: str) -> Dict[str, Any]:
+    """
+    Essaie tomllib (3.11+), puis tomli (3.9/3.10), puis toml (si installé).
+    Trace chaque tentative (ok/erreur).
+    """
+    parsers = _toml_parsers()
+    if not parsers:
+        _dbg("toml_lib_missing", lib="tomllib/tomli/toml")
+    for lib, loads in parsers:
+        _dbg("toml_parser_try", lib=lib)
+        try:
+            out = loads(txt)
+            _dbg("toml_parser_ok", lib=lib)
+            return out
+        except Exception as exc:
+            _dbg("toml_parser_fail", lib=lib, error=str(exc))
+            _log.warning("Failed to parse TOML with %s: %s", lib, exc)
 
     _dbg("toml_parser_all_failed")
     return {}
 
-def _load_yaml_text(txt: str) -> Dict[str, Any]:
+@lru_cache(maxsize=None)
+def _yaml_safe_load():
+    """yaml.safe_load si PyYAML est importable (résolu une seule fois), sinon l'erreur d'import."""
     try:
         import yaml
     except Exception as exc:
-        _dbg("yaml_lib_missing", error=str(exc))
-        _log.warning("PyYAML not available for YAML config parsing: %s", exc)
+        return exc
+    return yaml.safe_load
+
+def _load_yaml_text(txt: str) -> Dict[str, Any]:
+    safe_load = _yaml_safe_load()
+    if isinstance(safe_load, Exception):
+        _dbg("yaml_lib_missing", error=str(safe_load))
+        _log.warning("PyYAML not available for YAML config parsing: %s", safe_load)
         return {}
     try:
         _dbg("yaml_parser_try", lib="pyyaml")
-        data = yaml.safe_load(txt) or {}
+        data = safe_load(txt) or {}
         if not isinstance(data, dict):
             _dbg("yaml_parser_non_mapping")
             _log.warning("YAML root is not a mapping; ignoring.")
@@ -211,7 +273,18 @@ def _load_yaml_text(txt: str) -> Dict[str, Any]:
 def _parse_config_file(path: Path) -> Dict[str, Any]:
     """
     Lit le fichier, loggue taille/sha256 + aperçu masqué, puis parse selon l’extension.
+    Un seul read + decode ; une extension inconnue est écartée avant toute lecture.
     """
+    suffix = path.suffix.lower()
+    if suffix == ".toml":
+        loads = _load_toml_text
+    elif suffix in (".yaml", ".yml"):
+        loads = _load_yaml_text
+    else:
+        _dbg("config_unknown_extension", path=str(path), ext=suffix)
+        _log.warning("Unknown config extension '%s' for %s; ignoring.", suffix, path)
+        return {}
+
     try:
         b = path.read_bytes()
     except Exception as exc:
@@ -220,34 +293,44 @@ def _parse_config_file(path: Path) -> Dict[str, Any]:
     try:
         txt = b.decode("utf-8")
     except Exception as exc:
-        _dbg("config_decode_error", path=str(path), size=len(b), sha256=_sha256_bytes(b), error=str(exc))
+        if _DEBUG_ENABLED:
+            _dbg("config_decode_error", path=str(path), size=len(b), sha256=_sha256_bytes(b), error=str(exc))
         return {}
-    _dbg("config_read_ok", path=str(path), size=len(b), sha256=_sha256_bytes(b), preview=_redact_preview(txt))
+    if _DEBUG_ENABLED:
+        _dbg("config_read_ok", path=str(path), size=len(b), sha256=_sha256_bytes(b), preview=_redact_preview(txt))
+    del b  # only the text is needed from here on
 
-    suffix = path.suffix.lower()
-    if suffix == ".toml":
-        out = _load_toml_text(txt) or {}
-    elif suffix in (".yaml", ".yml"):
-        out = _load_yaml_text(txt) or {}
-    else:
-        _dbg("config_unknown_extension", path=str(path), ext=suffix)
-        _log.warning("Unknown config extension '%s' for %s; ignoring.", suffix, path)
-        out = {}
+    out = loads(txt)  # both loaders always return a dict ({} on failure)
 
-    _dbg("config_parsed", path=str(path), keys=sorted(list(out.keys())) if isinstance(out, dict) else "<non-dict>")
+    if _DEBUG_ENABLED:
+        _dbg("config_parsed", path=str(path), keys=sorted(list(out.keys())) if isinstance(out, dict) else "<non-dict>")
     return out
 
 # ---------- Merging & coercion ----------
 
 def _deep_merge(a: Dict[str, Any], b: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    b par-dessus a, récursivement sur les dicts, sans modifier a ni b.
+    Itératif : seuls les sous-dicts présents des deux côtés sont copiés
+    (copie à l'écriture), le reste est partagé comme avant.
+    """
     out = dict(a)
-    for k, v in b.items():
-        if isinstance(v, dict) and isinstance(out.get(k), dict):
-            out[k] = _deep_merge(out[k], v)
-        else:
-            out[k] = v
+    stack = [(out, b)]
+    while stack:
+        dst, src = stack.pop()
+        for k, v in src.items():
+            cur = dst.get(k)
+            if isinstance(v, dict) and isinstance(cur, dict):
+                cur = dst[k] = dict(cur)
+                stack.append((cur, v))
+            else:
+                dst[k] = v
     return out
 
+_PATH_KEYS = frozenset({"storage_dir", "calls_dir", "output", "output_dir"})
+_LIST_KEYS = frozenset({"formats", "gen_formats"})
+_COERCED_KEYS = _PATH_KEYS | _LIST_KEYS | {"limit", "targets", "additional_sys_path"}
+
 def _coerce_types(d: Dict[str, Any]) -> Dict[str, Any]:
     """
     Coerce quelques champs connus pour donner des types stables en aval.
@@ -256,30 +339,32 @@ def _coerce_types(d: Dict[str, Any]) -> Dict[str, Any]:
       - Lists[str]: formats, gen_formats
       - Targets: list[str]
       - additional_sys_path: list[str]
+    Seules les clés présentes sont visitées.
     """
-    from pathlib import Path as _P
-
     out = dict(d)
+    present = out.keys() & _COERCED_KEYS
+    if not present:
+        return out
 
     # Paths
-    for k in ("storage_dir", "calls_dir", "output", "output_dir"):
-        if k in out and isinstance(out[k], str):
-            out[k] = _P(out[k]).expanduser()
+    for k in present & _PATH_KEYS:
+        if isinstance(out[k], str):
+            out[k] = Path(out[k]).expanduser()
 
     # Ints
-    if "limit" in out and out["limit"] is not None:
+    if "limit" in present and out["limit"] is not None:
         try:
             out["limit"] = int(out["limit"])
         except Exception:
             pass
 
     # Lists[str]
-    for k in ("formats", "gen_formats"):
-        if k in out and out[k] is not None and not isinstance(out[k], (list, tuple)):
+    for k in present & _LIST_KEYS:
+        if out[k] is not None and not isinstance(out[k], (list, tuple)):
             out[k] = [str(out[k])]
 
     # Targets
-    if "targets" in out and out["targets"] is not None:
+    if "targets" in present and out["targets"] is not None:
         val = out["targets"]
         if isinstance(val, str):
             out["targets"] = [val]
@@ -292,7 +377,7 @@ def _coerce_types(d: Dict[str, Any]) -> Dict[str, Any]:
                 out["targets"] = [str(val)]
 
     # additional_sys_path → list[str]
-    if "additional_sys_path" in out and out["additional_sys_path"] is not None:
+    if "additional_sys_path" in present and out["additional_sys_path"] is not None:
         v = out["additional_sys_path"]
         if isinstance(v, (str, Path)):
             out["additional_sys_path"] = [str(v)]
@@ -304,15 +389,58 @@ def _coerce_types(d: Dict[str, Any]) -> Dict[str, Any]:
 def _effective(cmd: str, raw: Dict[str, Any]) -> Dict[str, Any]:
     eff = _deep_merge(raw.get("defaults", {}) or {}, raw.get(cmd, {}) or {})
     eff = _coerce_types(eff)
-    _dbg("effective_section", section=cmd, keys=sorted(list(eff.keys())))
+    # Keys parsed from TOML/YAML are fresh strings; interned, they match the
+    # literals used by getattr(args, ...)/eff.get(...) on identity, and end up
+    # as argparse attribute names via apply_effective_to_args.
+    eff = {sys.intern(k) if type(k) is str else k: v for k, v in eff.items()}
+    if _DEBUG_ENABLED:
+        _dbg("effective_section", section=cmd, keys=sorted(list(eff.keys())))
     _log.info("Effective config for [%s]: %s", cmd, eff if eff else "{}")
     return eff
 
-def _is_emptyish(v: Any) -> bool:
-    return v is None or (isinstance(v, (str, list, dict)) and len(v) == 0)
+# Types exacts produits par argparse et par les parseurs TOML/YAML.
+_SIZED_ARG_TYPES = frozenset({str, list, dict})
+
+def is_emptyish(v: Any) -> bool:
+    """
+    None, '', [], {} → True (utile pour args de CLI / config).
+    Test sur le type exact (un lookup) plutôt qu'isinstance : les valeurs
+    viennent d'argparse ou des parseurs, jamais de sous-classes.
+    """
+    if type(v) in _SIZED_ARG_TYPES:
+        return not v
+    return v is None
+
+@lru_cache(maxsize=256)
+def _realpath_abs(s: str) -> Path:
+    return Path(s).resolve()
+
+def resolve_path(p: Path | str) -> Path:
+    """
+    Path.resolve(), memoized for absolute inputs: one anchor goes through the
+    loader, the project-config walk and the root fallback, each resolving it
+    again. Relative inputs depend on the CWD and are resolved directly.
+    """
+    s = os.fspath(p)
+    return _realpath_abs(s) if os.path.isabs(s) else Path(s).resolve()
 
 # ---------- Public API (CLI-only) ----------
 
+# Packaged defaults text -> parsed mapping. The text is static for an installed
+# package, so it is parsed (pure-Python tomllib) once per process instead of on
+# every context build. Never mutated: _deep_merge copies what it changes.
+_PKG_DEFAULTS: Dict[str, Dict[str, Any]] = {}
+
+def _packaged_defaults(txt: str) -> Dict[str, Any]:
+    data = _PKG_DEFAULTS.get(txt)
+    if data is None:
+        data = _load_toml_text(txt)
+        if len(_PKG_DEFAULTS) >= 4:
+            _PKG_DEFAULTS.clear()
+        _PKG_DEFAULTS[txt] = data
+    else:
+        _dbg("packaged_default_parse_cached")
+    return data
 
 def load_layered_config(start: Optional[Path] = None) -> ConfigContext:
     """
@@ -346,118 +474,189 @@ def load_layered_config(start: Optional[Path] = None) -> ConfigContext:
         path used (if any), and the debug event buffer.
     """
     # Reset debug-event buffer
-    global _DEBUG_EVENTS
+    global _DEBUG_EVENTS, _DEBUG_ENABLED
     _DEBUG_EVENTS = []
+    _DEBUG_ENABLED = _config_debug_enabled()
 
-    # 1) Packaged defaults
-    base: Dict[str, Any] = {}
     try:
-        txt = ir.files("pytead").joinpath("default_config.toml").read_text(encoding="utf-8")
-        _dbg("packaged_default_found", path="pytead/default_config.toml", size=len(txt))
-        pkg = _load_toml_text(txt) or {}
-        base = _deep_merge(base, pkg)
+        pkg_txt: Optional[str] = ir.files("pytead").joinpath("default_config.toml").read_text(encoding="utf-8")
+        _dbg("packaged_default_found", path="pytead/default_config.toml", size=len(pkg_txt))
     except Exception as exc:
+        pkg_txt = None
         _dbg("packaged_default_missing", error=str(exc))
         _log.info("No packaged defaults (pytead/default_config.toml): %s", exc)
 
-    # 2) User-level config
     user_cfg_path = _find_user_config()
+
+    #    - When `start` is provided, we strictly anchor on it (ignore process CWD).
+    #    - When `start` is None (e.g., some non-script CLIs), we consciously adopt
+    #      the process CWD as the anchor to keep those commands usable.
+    if start is None:
+        anchor = resolve_path(os.getcwd())
+        _dbg("no_start_anchor_cwd_used", anchor=str(anchor))
+    else:
+        anchor = resolve_path(start)
+        _dbg("anchor_from_start", anchor=str(anchor))
+
+    proj_cfg_path, proj_cfg_root = _find_project_config_and_root(anchor)
+
+    # 1) Packaged defaults
+    base: Dict[str, Any] = {}
+    if pkg_txt is not None:
+        pkg = _packaged_defaults(pkg_txt)
+        base = _deep_merge(base, pkg)
+
+    # 2) User-level config
     if user_cfg_path:
         try:
             data = _parse_config_file(user_cfg_path)
             base = _deep_merge(base, data)
-            _dbg("user_config_merged", path=str(user_cfg_path), top_keys=sorted(list(data.keys())))
+            if _DEBUG_ENABLED:
+                _dbg("user_config_merged", path=str(user_cfg_path), top_keys=sorted(list(data.keys())))
         except Exception as exc:
             _dbg("user_config_parse_error", path=str(user_cfg_path), error=str(exc))
             _log.warning("Failed to parse user config %s: %s", user_cfg_path, exc)
 
     # 3) Project-level config (anchored)
-    #    - When `start` is provided, we strictly anchor on it (ignore process CWD).
-    #    - When `start` is None (e.g., some non-script CLIs), we consciously adopt
-    #      the process CWD as the anchor to keep those commands usable.
     source_path: Optional[Path] = None
-    if start is None:
-        anchor = Path.cwd().resolve()
-        _dbg("no_start_anchor_cwd_used", anchor=str(anchor))
-    else:
-        anchor = Path(start).resolve()
-        _dbg("anchor_from_start", anchor=str(anchor))
-
-    proj_cfg_path = _find_project_config(anchor)
     if proj_cfg_path:
         # Merge project config and derive project_root from its location.
         try:
             data = _parse_config_file(proj_cfg_path)
             base = _deep_merge(base, data)
-            _dbg("project_config_merged", path=str(proj_cfg_path), top_keys=sorted(list(data.keys())))
+            if _DEBUG_ENABLED:
+                _dbg("project_config_merged", path=str(proj_cfg_path), top_keys=sorted(list(data.keys())))
         except Exception as exc:
             _dbg("project_config_parse_error", path=str(proj_cfg_path), error=str(exc))
             _log.warning("Failed to parse project config %s: %s", proj_cfg_path, exc)
 
         source_path = proj_cfg_path
-        cfg_dir = proj_cfg_path.parent
-        project_root = cfg_dir.parent if cfg_dir.name == ".pytead" else cfg_dir
+        # The finder only matches '<dir>/.pytead/config.*' and reports <dir>.
+        project_root = proj_cfg_root
         _dbg("project_root_from_config", project_root=str(project_root))
     else:
         # No project config; compute deterministic fallback from the anchor.
         project_root = _resolve_project_root_fallback(anchor)
 
-    ctx = ConfigContext(raw=base, project_root=project_root, source_path=source_path, debug=list(_DEBUG_EVENTS))
-    _dbg(
-        "ctx_summary",
-        project_root=str(project_root),
-        source=str(source_path or "<none>"),
-        top_keys=sorted(list(base.keys())),
+    ctx = ConfigContext(
+        raw=base,
+        project_root=project_root,
+        source_path=source_path,
+        debug=list(_DEBUG_EVENTS),
+        user_source_path=user_cfg_path,
     )
+    if _DEBUG_ENABLED:
+        _dbg(
+            "ctx_summary",
+            project_root=str(project_root),
+            source=str(source_path or "<none>"),
+            top_keys=sorted(list(base.keys())),
+        )
     return ctx
+
+
+def clear_config_cache() -> None:
+    """Forget memoized packaged defaults and resolved paths (tests, long-lived processes)."""
+    _PKG_DEFAULTS.clear()
+    _RESOLVED_UNDER_ROOT.clear()
+    _realpath_abs.cache_clear()
+
+
 def effective_section(ctx: ConfigContext, section: str) -> Dict[str, Any]:
-    return _effective(section, ctx.raw)
+    """
+    Merged + coerced view of [defaults] <- [section], computed once per context.
+    A shallow copy is returned so callers may add/pop keys freely.
+    """
+    return dict(_effective_view(ctx, section))
+
+def _effective_view(ctx: ConfigContext, section: str) -> Dict[str, Any]:
+    """The memoized section itself (no copy): read-only use inside this module."""
+    cache = ctx._effective_cache
+    eff = cache.get(section)
+    if eff is None:
+        eff = cache[section] = _effective(section, ctx.raw)
+    return eff
+
+def effective_sections(ctx: ConfigContext, *names: str) -> Dict[str, Dict[str, Any]]:
+    """{section: effective_section(ctx, section)} for handlers reading several sections."""
+    return {n: effective_section(ctx, n) for n in names}
 
 def apply_effective_to_args(section: str, ctx: ConfigContext, args) -> None:
     """
     Fill argparse fields that were NOT provided on the CLI using the effective section.
     Also fill when the field exists but is "emptyish".
     """
-    eff = effective_section(ctx, section)
+    eff = _effective_view(ctx, section)  # only read here: no copy
     box = vars(args)
-    _log.info("Args BEFORE fill: %s", {k: box[k] for k in sorted(box)})
-    for k, v in eff.items():
-        if k not in box or _is_emptyish(box[k]):
-            box[k] = v
+    # Keys the CLI did not set at all need no emptiness check.
+    absent = eff.keys() - box.keys()
+    missing = [k for k in eff if k in absent or is_emptyish(box[k])]
+    if not missing:
+        # Everything the config could provide is already set on the CLI.
+        return
+    verbose = _log.isEnabledFor(logging.INFO)
+    if verbose:
+        _log.info("Args BEFORE fill: %s", {k: box[k] for k in sorted(box)})
+    for k in missing:
+        v = eff[k]
+        # The memoized section is shared by every reader of this ctx: args
+        # get their own copy of list values (targets, additional_sys_path).
+        box[k] = list(v) if type(v) is list else v
+        if _DEBUG_ENABLED:
             _dbg("arg_filled", section=section, name=k, value=str(v))
+        if verbose:
             _log.info("  -> filled '%s' from config: %r", k, v)
-    _log.info("Args AFTER  fill: %s", {k: box[k] for k in sorted(box)})
+    if verbose:
+        _log.info("Args AFTER  fill: %s", {k: box[k] for k in sorted(box)})
+
+# (project_root, raw value) -> resolved path. The same storage/output values go
+# through several helpers (validation, diagnostics, write setup) per command.
+_RESOLVED_UNDER_ROOT: Dict[tuple, Path] = {}
+_RESOLVED_UNDER_ROOT_MAX = 256
 
 def resolve_under_project_root(ctx: ConfigContext, p: Path | str | None) -> Path | None:
     """Return an absolute path anchored under ctx.project_root for relative inputs."""
     if p is None:
         return None
     pp = p if isinstance(p, Path) else Path(p).expanduser()
+    key = (ctx.project_root, pp)  # after expanduser: '~' follows $HOME
+    hit = _RESOLVED_UNDER_ROOT.get(key)
+    if hit is not None:
+        return hit
     if not pp.is_absolute():
         pp = ctx.project_root / pp
     try:
-        return pp.resolve()
+        out = pp.resolve()
     except Exception:
         return pp
+    if len(_RESOLVED_UNDER_ROOT) >= _RESOLVED_UNDER_ROOT_MAX:
+        _RESOLVED_UNDER_ROOT.clear()
+    _RESOLVED_UNDER_ROOT[key] = out
+    return out
 
 def _path_status(p: Path | None) -> str:
     if p is None:
         return "None"
     try:
-        exists = p.exists()
-        is_dir = p.is_dir()
-        return f"{p} (exists={exists}, is_dir={is_dir})"
+        st = os.stat(p)  # single stat for both flags
+    except (FileNotFoundError, NotADirectoryError):
+        return f"{p} (exists=False, is_dir=False)"
     except Exception as exc:
         return f"{p} (stat_error={exc!r})"
+    return f"{p} (exists=True, is_dir={stat.S_ISDIR(st.st_mode)})"
 
-def render_config_debug_report(ctx: ConfigContext, include_previews: bool = True) -> str:
+def render_config_debug_report(
+    ctx: ConfigContext, include_previews: bool = True, *, cwd: Optional[Path] = None
+) -> str:
     """
     Rapport détaillé retraçant découverte, ouverture, parsing (y compris erreurs),
-    et sections effectives.
+    et sections effectives. `cwd` : CWD déjà résolu par l'appelant, le cas échéant.
     """
+    if cwd is None:
+        cwd = resolve_path(os.getcwd())
     lines: List[str] = []
     lines.append("=== pytead CONFIG DEBUG REPORT ===")
-    lines.append(f"cwd          : {Path.cwd().resolve()}")
+    lines.append(f"cwd          : {cwd}")
     lines.append(f"project_root : {ctx.project_root}")
     lines.append(f"config_source: {ctx.source_path or '<none>'}")
     lines.append("")
@@ -476,15 +675,14 @@ def render_config_debug_report(ctx: ConfigContext, include_previews: bool = True
         events.append(evc)
 
     if not events:
-        lines.append("(no debug events captured)")
+        lines.append("(no debug events captured; set PYTEAD_CONFIG_DEBUG=1 to record them)")
     else:
         lines.append("Events:")
         lines.extend(fmt(e) for e in events)
 
     lines.append("")
     lines.append("Top-level keys in layered config: " + ", ".join(sorted(ctx.raw.keys())))
-    for sec in ("defaults", "run", "gen", "tead", "types"):
-        eff = _effective(sec, ctx.raw)
+    for sec, eff in effective_sections(ctx, "defaults", "run", "gen", "tead", "types").items():
         keys = ", ".join(sorted(eff.keys())) if eff else "<empty>"
         lines.append(f"Effective [{sec}] keys: {keys}")
     return "\n".join(lines)
@@ -494,40 +692,44 @@ def diagnostics_for_storage_dir(ctx: ConfigContext, section: str, cli_value: Pat
     Rapport humain enrichi (résolution du storage_dir) + **rapport complet de config**.
     Ce texte est déjà affiché par les commandes quand ça plante.
     """
-    eff_sec = effective_section(ctx, section) or {}
-    eff_def = effective_section(ctx, "defaults") or {}
-    eff_typ = effective_section(ctx, "types") or {}
+    effs = effective_sections(ctx, section, "defaults", "types")
+    eff_sec, eff_def, eff_typ = effs[section], effs["defaults"], effs["types"]
 
     c_cli  = cli_value
     c_sec  = eff_sec.get("storage_dir")
     c_def  = eff_def.get("storage_dir")
     c_typ  = eff_typ.get("storage_dir")
 
-    r_cli  = resolve_under_project_root(ctx, c_cli)
-    r_sec  = resolve_under_project_root(ctx, c_sec)
-    r_def  = resolve_under_project_root(ctx, c_def)
-    r_typ  = resolve_under_project_root(ctx, c_typ)
+    # The four candidates are often the same value ([defaults] inherited by the
+    # section): resolve and stat each distinct one once.
+    status: Dict[Any, str] = {}
+
+    def _status_of(raw: Path | str | None) -> str:
+        if raw not in status:
+            status[raw] = _path_status(resolve_under_project_root(ctx, raw))
+        return status[raw]
 
     lines: List[str] = []
     lines.append("=== pytead GEN diagnostics (storage_dir) ===")
-    lines.append(f"cwd           : {Path.cwd().resolve()}")
+    cwd = resolve_path(os.getcwd())  # shared with the embedded config report
+    lines.append(f"cwd           : {cwd}")
     lines.append(f"project_root  : {ctx.project_root}")
     lines.append(f"config_source : {ctx.source_path or '<none>'}")
     lines.append("")
-    lines.append(f"CLI storage_dir      : {c_cli!r} -> {_path_status(r_cli)}")
-    lines.append(f"[{section}].storage_dir : {c_sec!r} -> {_path_status(r_sec)}")
-    lines.append(f"[defaults].storage_dir : {c_def!r} -> {_path_status(r_def)}")
-    lines.append(f"[types].storage_dir    : {c_typ!r} -> {_path_status(r_typ)}")
+    lines.append(f"CLI storage_dir      : {c_cli!r} -> {_status_of(c_cli)}")
+    lines.append(f"[{section}].storage_dir : {c_sec!r} -> {_status_of(c_sec)}")
+    lines.append(f"[defaults].storage_dir : {c_def!r} -> {_status_of(c_def)}")
+    lines.append(f"[types].storage_dir    : {c_typ!r} -> {_status_of(c_typ)}")
     lines.append("")
     lines.append("Effective sections snapshot:")
     for sec in ("defaults", section, "types"):
-        eff = effective_section(ctx, sec)
+        eff = effs[sec]
         keys = ", ".join(sorted(eff.keys())) if eff else "<empty>"
         lines.append(f"  - [{sec}] keys: {keys}")
 
     # --- Ajout : rapport complet (découverte/lecture/parsing) ---
     lines.append("")
-    lines.append(render_config_debug_report(ctx, include_previews=True))
+    lines.append(render_config_debug_report(ctx, include_previews=True, cwd=cwd))
 
     return "\n".join(lines)
 
@@ -553,7 +755,7 @@ def _nearest_marker_dir(base: Path, markers: list[str], *, kind: str) -> Optiona
         The directory that *contains* the marker (i.e., the candidate project root),
         or None if no marker is found up to the filesystem root.
     """
-    cur = base.resolve()
+    cur = resolve_path(base)
     if cur.is_file():
         cur = cur.parent
 
@@ -593,7 +795,7 @@ def _resolve_project_root_fallback(anchor: Path) -> Path:
     - This function *never* looks at the process CWD on its own;
       it only operates relative to the given `anchor`.
     """
-    base = anchor.resolve()
+    base = resolve_path(anchor)
     if base.is_file():
         base = base.parent
 
@@ -1,27 +1,54 @@
 # pytead/cli/main.py
 import argparse
+import importlib
 import sys as _sys
+from typing import List, Optional
 from ..logconf import configure_logger
-from .cmd_run import add_run_subparser
-from .cmd_gen import add_gen_subparser
-from .cmd_tead import add_tead_subparser
-from .cmd_types import add_types_subparser
 from ..errors import PyteadError
 
-def main() -> None:
+# Subcommand -> (module under pytead.cli, function registering its subparser, help).
+# Only the selected subcommand's module is imported and its parser built; the
+# help line is repeated here so `pytead -h` can list commands without importing
+# any of them (tests check it matches what each module registers).
+_SUBCOMMANDS = {
+    "run": ("cmd_run", "add_run_subparser", "instrument targets then run a Python script"),
+    "gen": ("cmd_gen", "add_gen_subparser", "generate pytest tests from traces"),
+    "tead": ("cmd_tead", "add_tead_subparser", "instrument & run a script, then generate tests"),
+    "types": ("cmd_types", "add_types_subparser", "generate .pyi type stubs from traces"),
+}
+
+
+def _build_parser(argv: List[str]) -> argparse.ArgumentParser:
+    """
+    Build the CLI parser for `argv`: when argv[0] names a subcommand (the
+    top-level parser has no other positional), only that one gets its real
+    subparser; otherwise (help, typo, nothing) every command is registered as
+    a name+help stub, which is all argparse needs to list the choices or
+    report an invalid one.
+    """
     parser = argparse.ArgumentParser(prog="pytead")
     subparsers = parser.add_subparsers(dest="command", required=True)
 
-    add_run_subparser(subparsers)
-    add_gen_subparser(subparsers)
-    add_tead_subparser(subparsers)
-    add_types_subparser(subparsers)
+    cmd = argv[0] if argv and argv[0] in _SUBCOMMANDS else None
+    if cmd is None:
+        for name, (_module, _adder, help_text) in _SUBCOMMANDS.items():
+            subparsers.add_parser(name, help=help_text)
+        return parser
+
+    module_name, adder, _help = _SUBCOMMANDS[cmd]
+    module = importlib.import_module(f".{module_name}", __package__)
+    getattr(module, adder)(subparsers)
+    return parser
 
-    args = parser.parse_args()
+
+def main(argv: Optional[List[str]] = None) -> None:
+    argv = _sys.argv[1:] if argv is None else list(argv)
+    parser = _build_parser(argv)
+
+    args = parser.parse_args(argv)
     try:
         args.handler(args)
     except PyteadError as exc:
         logger = configure_logger(name="pytead")
         logger.error("%s", exc)
         _sys.exit(1)
-
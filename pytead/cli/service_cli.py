@@ -2,18 +2,17 @@
 from __future__ import annotations
 
 import logging
-import runpy
 import sys
 from dataclasses import dataclass
 from enum import Enum, auto
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Sequence, Tuple
 
-from ..imports import compute_import_roots, prepend_sys_path
-from ..storage import get_storage as _get_storage
-from ..gen_tests import collect_entries, render_tests, write_tests, write_tests_per_func
-from ._cli_utils import unique_count  # optionally swap to a with-self variant
-from ..typing_defs import StorageLike
+# Each service imports what it needs when called: importing this module (for
+# its result models, or one service) does not pull in config_cli via
+# _cli_utils, nor the import-root / storage helpers.
+if TYPE_CHECKING:
+    from ..typing_defs import StorageLike
 
 
 __all__ = [
@@ -87,25 +86,20 @@ def prepare_import_env(
     Returns:
         The effective absolute roots (as strings) that were inserted (in order).
     """
+    from ..imports import compute_import_roots, prepend_sys_path
+
     # Delegate to the shared resolver (keeps stable deterministic ordering).
     roots = compute_import_roots(script_path, additional_paths, project_root=project_root)
 
     # Enforce "project_root first" if provided, while preserving order and deduplicating.
     if project_root is not None:
-        pr = str(Path(project_root).resolve())
         # Bring pr to the front, then keep others in order (no duplicates).
-        ordered = [pr] + [r for r in roots if r != pr]
-        # Final de-dup in case compute_import_roots already included pr at pos 0.
-        seen: set[str] = set()
-        deduped: List[str] = []
-        for r in ordered:
-            if r not in seen:
-                deduped.append(r)
-                seen.add(r)
-        roots = deduped
+        pr = Path(project_root).resolve().as_posix()
+        roots = list(dict.fromkeys([pr, *roots]))
 
     # Actually prepend into sys.path (front-load, left-to-right).
-    prepend_sys_path(roots)
+    # Every root is already absolute and resolved: no second realpath pass.
+    prepend_sys_path(roots, resolved=True)
 
     if logger:
         logger.info("Import roots: %s", roots)
@@ -122,12 +116,13 @@ def instrument_targets(
     """
     Resolve and instrument targets. `storage` may be a StorageLike or a name ("pickle"/"json"/"repr").
     """
-    
+    from ..storage import get_storage
     from ..targets import instrument_targets as targets_instrument
 
-    st = _get_storage(storage) if isinstance(storage, str) else storage
+    st = get_storage(storage) if isinstance(storage, str) else storage
     seen = targets_instrument(targets, limit=limit, storage_dir=storage_dir, storage=st)
-    if logger:
+    # The sorted listing only exists for this message: skip it when INFO is off.
+    if logger and logger.isEnabledFor(logging.INFO):
         logger.info("Instrumented %d target(s): %s", len(seen), ", ".join(sorted(seen)))
     return InstrumentResult(seen=frozenset(seen), storage_dir=storage_dir, format_name=st.extension.lstrip("."))
 
@@ -150,7 +145,12 @@ def run_script(
     if script_file.suffix != ".py":
         return RunOutcome(RunStatus.EXCEPTION, detail=f"Unsupported script: {script_file}")
 
-    sys.argv = argv
+    import runpy  # only `run`/`tead` execute scripts
+
+    # The script gets its own copy; ours is put back afterwards so later phases
+    # in the same process (e.g. tead's generation step) see a clean sys.argv.
+    old_argv = sys.argv
+    sys.argv = list(argv)
     old_cwd: Optional[Path] = None
 
     try:
@@ -179,6 +179,7 @@ def run_script(
         return RunOutcome(RunStatus.EXCEPTION, detail=repr(exc))
 
     finally:
+        sys.argv = old_argv
         # Always restore the original CWD (best-effort).
         if old_cwd is not None:
             try:
@@ -194,12 +195,16 @@ def collect_traces(
     storage_dir: Path,
     formats: Optional[List[str]] = None,
     *,
+    only_funcs: Optional[List[str]] = None,
     logger: Optional[logging.Logger] = None,
 ) -> Dict[str, List[Dict[str, Any]]]:
     """
-    Load all trace entries grouped by function FQN from `storage_dir`.
+    Load all trace entries grouped by function FQN from `storage_dir`
+    (only those of `only_funcs` when given).
     """
-    entries = collect_entries(storage_dir=storage_dir, formats=formats)
+    from ..gen_tests import collect_entries  # lazy: renderer machinery
+
+    entries = collect_entries(storage_dir=storage_dir, formats=formats, only_funcs=only_funcs)
     if logger:
         logger.info("Collected traces for %d function(s).", len(entries))
     return entries
@@ -232,6 +237,9 @@ def emit_tests(
     GenerationResult
         Summary with number of files written, unique cases count, and the output directory.
     """
+    from ..gen_tests import write_tests_per_func  # lazy: renderer machinery
+    from ._cli_utils import unique_count
+
     # Count unique cases across all functions (graph-json and pickle handled upstream).
     uniq = unique_count(entries_by_func)
 
@@ -321,22 +329,21 @@ def collect_and_emit_tests(
             logger.info("Storage dir '%s' does not exist — skipping generation.", storage_dir)
         return None
 
+    # Optional filtering by a subset of targets: other functions' trace files
+    # are skipped before being decoded.
+    # Sorted once: used both for the filter and in the "no match" message.
+    tgt = sorted(set(only_targets)) if only_targets else None
+
     # Load traces (grouped by fully-qualified function name).
-    entries = collect_traces(storage_dir, formats, logger=logger)
+    entries = collect_traces(storage_dir, formats, only_funcs=tgt, logger=logger)
     if not entries:
         if logger:
-            logger.warning("No traces found in '%s'.", storage_dir)
+            if tgt:
+                logger.warning("No traces in '%s' match targets: %s", storage_dir, tgt)
+            else:
+                logger.warning("No traces found in '%s'.", storage_dir)
         return None
 
-    # Optional filtering by a subset of targets.
-    if only_targets:
-        tgt = set(only_targets)
-        entries = {k: v for (k, v) in entries.items() if k in tgt}
-        if not entries:
-            if logger:
-                logger.warning("Traces exist but none match targets: %s", sorted(tgt))
-            return None
-
     # No implicit defaults here: the caller must provide output_dir.
     if output_dir is None:
         raise ValueError("collect_and_emit_tests: 'output_dir' must be provided by the caller (see config).")
@@ -5,6 +5,7 @@ from __future__ import annotations
 from collections import defaultdict
 from pathlib import Path
 import logging
+import os
 import textwrap
 import pprint
 import uuid
@@ -16,6 +17,7 @@ import importlib.util
 from types import ModuleType
 from typing import Any, Dict, List, Union, Optional, Tuple, Set
 from contextlib import contextmanager
+from functools import lru_cache
 
 from .storage import iter_entries
 
@@ -23,7 +25,7 @@ from .normalize import sanitize_for_py_literals, tuples_to_lists
 
 from .errors import GenerationError, OrphanRefInExpected
 from .graph_utils import find_orphan_refs_in_rendered, inline_and_project_expected
-from ._cases import unique_cases, render_case, case_id
+from ._cases import unique_cases, render_case, case_id, clear_pformat_cache
 
 from .typing_defs import TraceEntry, is_graph_entry
 
@@ -168,6 +170,12 @@ def _collect_types_recursively(cls: Any, all_types: set, processed: set, global_
         pass
 
 
+@lru_cache(maxsize=1024)
+def _module_rel_path(module_fqn: str) -> str:
+    """'pkg.mod' -> 'pkg/mod.py' (OS separators); the same prefixes are probed for every function."""
+    return os.path.join(*module_fqn.split(".")) + ".py"
+
+
 def _load_module_from_fqn(module_fqn: str) -> Optional[ModuleType]:
     """
     Try to import a module by name first. If it fails, search sys.path for a
@@ -177,20 +185,25 @@ def _load_module_from_fqn(module_fqn: str) -> Optional[ModuleType]:
     the *generated* test file will later bootstrap import_roots. Here, we mimic
     that environment by temporarily adjusting sys.path (see context manager below).
     """
+    # Called for every prefix of every traced function: modules seen before are
+    # answered from sys.modules, without invalidating the finder caches again.
+    cached = sys.modules.get(module_fqn)
+    if cached is not None:
+        return cached
     try:
         importlib.invalidate_caches()
         return importlib.import_module(module_fqn)
     except ImportError:
         log.debug("Direct import of '%s' failed; trying file-based loading.", module_fqn)
 
-    parts = module_fqn.split(".")
-    relative_path = Path(*parts).with_suffix(".py")
+    relative_path = _module_rel_path(module_fqn)
 
     for base in sys.path:
         if not base:
             continue
-        candidate = Path(base) / relative_path
-        if candidate.is_file():
+        # Probe with plain strings; a Path is only built for the file we load.
+        if os.path.isfile(os.path.join(base, relative_path)):
+            candidate = Path(base) / relative_path
             try:
                 spec = importlib.util.spec_from_file_location(module_fqn, candidate)
                 if spec and spec.loader:
@@ -591,6 +604,7 @@ def render_state_tests(
         lines.append(f"def test_{module_sanitized}_{func_name}(case):")
         lines.append(f"    _tk_run({func_fullname!r}, case)")
         lines.append("")
+    clear_pformat_cache()
     return "\n".join(lines)
 
 
@@ -605,15 +619,22 @@ def _temporarily_prepend_sys_path(roots: list[str]):
     will later bootstrap at runtime.
     """
     old = list(sys.path)
+    present = set(old)  # membership in O(1) instead of scanning sys.path per root
     try:
         for p in reversed(roots or []):
-            if p and p not in sys.path:
+            if p and p not in present:
+                present.add(p)
                 sys.path.insert(0, p)
         yield
     finally:
         sys.path[:] = old
 
 
+def _write_source(path: Path, source: str) -> None:
+    """Write generated source as UTF-8 bytes (one open/write/close, no text layer)."""
+    path.write_bytes(source.encode("utf-8"))
+
+
 def write_tests_per_func(
     entries_by_func: Dict[str, List[TraceEntry]],
     output_dir: Union[str, Path],
@@ -708,36 +729,39 @@ def write_tests_per_func(
                     )
 
             source = "\n".join(bootstrap_lines + import_lines) + "\n\n" + "\n\n".join(test_functions) + "\n"
-            (out_path / filename).write_text(source, encoding="utf-8")
+            _write_source(out_path / filename, source)
             
         else:
             # State-based (pickle): single parameterized module (one function)
             filename = f"test_{module_sanitized}.py"
             source = render_state_tests({func_fullname: entries}, import_roots=resolved_roots)
-            (out_path / filename).write_text(
-                source + ("" if source.endswith("\n") else "\n"),
-                encoding="utf-8",
-            )
+            _write_source(out_path / filename, source + ("" if source.endswith("\n") else "\n"))
 
 # ---------------------------------------------------------------------------
 # Public API
 # ---------------------------------------------------------------------------
 
 def collect_entries(
-    storage_dir: Union[str, Path], formats: Optional[List[str]] = None
+    storage_dir: Union[str, Path],
+    formats: Optional[List[str]] = None,
+    only_funcs: Optional[List[str]] = None,
 ) -> Dict[str, List[TraceEntry]]:
     """
     Group trace entries by function FQN from a calls directory.
+    With `only_funcs`, trace files of other functions are not even loaded.
     """
     path = Path(storage_dir)
-    if not path.exists() or not path.is_dir():
+    if not os.path.isdir(path):  # one stat covers both "missing" and "not a dir"
         raise ValueError(f"Calls directory '{storage_dir}' does not exist or is not a directory")
     entries_by_func: Dict[str, List[TraceEntry]] = defaultdict(list)
-    for entry in iter_entries(path, formats=formats):
+    wanted = set(only_funcs) if only_funcs is not None else None
+    for entry in iter_entries(path, formats=formats, only_funcs=wanted):
         func = entry.get("func")
         if not func:
             log.warning("Skipping trace without 'func'")
             continue
+        if wanted is not None and func not in wanted:
+            continue
         entries_by_func[func].append(entry)
     return dict(entries_by_func)
 
@@ -786,5 +810,5 @@ def write_tests(source: str, output_file: Union[str, Path]) -> None:
     """
     output_path = Path(output_file)
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    output_path.write_text(source + ("\n" if not source.endswith("\n") else ""), encoding="utf-8")
+    _write_source(output_path, source + ("\n" if not source.endswith("\n") else ""))
 
@@ -333,16 +333,13 @@ def render_stub_for_function(func_name: str, info: FunctionTypeInfo) -> str:
     return f"def {func_name}({', '.join(parts)}) -> {ret_txt}: ..."
 
 
+# En-tête commun à tous les modules : construit une fois, pas à chaque appel.
+_STUB_HEADER = "# Auto-generated by pytead types — DO NOT EDIT.\nfrom typing import *\n\n"
+
+
 def render_stub_module(module: str, funcs: dict[str, FunctionTypeInfo]) -> str:
-    lines = [
-        "# Auto-generated by pytead types — DO NOT EDIT.",
-        "from typing import *",
-        "",
-    ]
-    for fn in sorted(funcs):
-        lines.append(render_stub_for_function(fn, funcs[fn]))
-        lines.append("")
-    return "\n".join(lines).rstrip() + "\n"
+    body = "\n\n".join(render_stub_for_function(fn, funcs[fn]) for fn in sorted(funcs))
+    return (_STUB_HEADER + body).rstrip() + "\n"
 
 
 def group_by_module(
@@ -10,6 +10,7 @@ from .graph_utils import project_anchored_to_rendered, find_orphan_refs_in_rende
 
 _log = logging.getLogger("pytead.graph_capture")
 _OPAQUE_REPR_RE = re.compile(r"^<[\w\.]+ object at 0x[0-9A-Fa-f]+>$")
+_MISSING = object()
 
 def _safe_repr_or_classname(obj: Any) -> str:
     try:
@@ -24,10 +25,13 @@ def _safe_repr_or_classname(obj: Any) -> str:
 
 def _get_object_attributes(obj: Any) -> Dict[str, Any]:
     attrs: Dict[str, Any] = {}
-    if hasattr(obj, "__dict__"):
-        attrs.update(vars(obj))
-    if hasattr(obj, "__slots__"):
-        for name in obj.__slots__:
+    # One lookup each (hasattr + access would resolve every attribute twice).
+    inst_dict = getattr(obj, "__dict__", _MISSING)
+    if inst_dict is not _MISSING:
+        attrs.update(inst_dict)
+    slots = getattr(obj, "__slots__", _MISSING)
+    if slots is not _MISSING:
+        for name in slots:
             try:
                 if name not in attrs:
                     attrs[name] = getattr(obj, name)
@@ -72,19 +72,16 @@ def compute_import_roots(
     Return absolute, de-duplicated strings.
     """
     roots: list[Path] = []
-    proj_root = project_root or _auto_detect_project_root(
-        Path(script_path).parent
-        if (script_path and str(script_path).endswith(".py"))
-        else None
-    )
+    # Build the Path and test its suffix once; both steps below need it.
+    sp = Path(script_path) if script_path else None
+    script_dir = sp.parent if (sp is not None and sp.suffix == ".py") else None
+    proj_root = project_root or _auto_detect_project_root(script_dir)
 
     # 1) script dir
-    if script_path:
-        sp = Path(script_path)
-        if sp.suffix == ".py":
-            sd = _to_abs_dir(sp.parent)
-            if sd is not None:
-                roots.append(sd)
+    if script_dir is not None:
+        sd = _to_abs_dir(script_dir)
+        if sd is not None:
+            roots.append(sd)
 
     # 2) project root
     pr = _to_abs_dir(proj_root)
@@ -100,33 +97,32 @@ def compute_import_roots(
             roots.append(ap)
 
     # de-dup while preserving order
-    seen: set[str] = set()
-    out: list[str] = []
-    for rr in roots:
-        s = rr.as_posix()
-        if s not in seen:
-            seen.add(s)
-            out.append(s)
-    return out
+    return list(dict.fromkeys(rr.as_posix() for rr in roots))
 
 
-def prepend_sys_path(roots: Iterable[Pathish]) -> None:
+def _resolved_posix(r: Pathish) -> str:
+    p = Path(r)
+    try:
+        return p.resolve().as_posix()
+    except OSError:
+        # Nonexistent/unreadable: keep a pure-string absolute form (no stat).
+        return Path(os.path.abspath(p)).as_posix()
+
+
+def prepend_sys_path(roots: Iterable[Pathish], *, resolved: bool = False) -> None:
     """
     Prepend sys.path with the given roots (strings or Paths),
     preserving input order and avoiding duplicates.
+
+    Pass `resolved=True` when the roots already come out of
+    `compute_import_roots` (absolute, resolved): they are used as-is.
     """
-    normed: list[str] = []
-    seen: set[str] = set()
-    for r in roots:
-        p = Path(r)
-        try:
-            s = p.resolve().as_posix()
-        except Exception:
-            s = p.as_posix()
-        if s not in seen:
-            seen.add(s)
-            normed.append(s)
+    if resolved:
+        normed = list(dict.fromkeys(os.fspath(r) for r in roots))
+    else:
+        normed = list(dict.fromkeys(_resolved_posix(r) for r in roots))
 
+    present = set(sys.path)
     for s in reversed(normed):
-        if s not in sys.path:
+        if s not in present:
             sys.path.insert(0, s)
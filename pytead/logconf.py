@@ -1,11 +1,18 @@
 import logging
 
+# Set once the "pytead" logger has a stream handler: every CLI handler calls
+# `configure_logger`, only the first call needs to inspect the handler list.
+_handler_ready = False
+
 
 def configure_logger(level: int = logging.INFO, name: str = "pytead") -> logging.Logger:
+    global _handler_ready
     root = logging.getLogger("pytead")
-    if not any(isinstance(h, logging.StreamHandler) for h in root.handlers):
-        handler = logging.StreamHandler()
-        handler.setFormatter(logging.Formatter("[pytead] %(levelname)s: %(message)s"))
-        root.addHandler(handler)
+    if not _handler_ready:
+        if not any(isinstance(h, logging.StreamHandler) for h in root.handlers):
+            handler = logging.StreamHandler()
+            handler.setFormatter(logging.Formatter("[pytead] %(levelname)s: %(message)s"))
+            root.addHandler(handler)
+        _handler_ready = True
     root.setLevel(level)
     return logging.getLogger(name)
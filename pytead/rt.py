@@ -45,12 +45,15 @@ def resolve_attr(fq: str) -> Any:
     parts = fq.split(".")
     for i in range(len(parts), 0, -1):
         mod_name = ".".join(parts[:i])
-        try:
-            obj = importlib.import_module(mod_name)
-            rest = parts[i:]
-            break
-        except Exception:
-            continue
+        # Runs once per test case: already-imported modules are a dict lookup.
+        obj = sys.modules.get(mod_name)
+        if obj is None:
+            try:
+                obj = importlib.import_module(mod_name)
+            except Exception:
+                continue
+        rest = parts[i:]
+        break
     else:
         raise ImportError(f"Cannot import any prefix of {fq!r}")
     for name in rest:
@@ -63,7 +66,7 @@ def rehydrate(type_fq: str, state: Optional[Dict[str, Any]]) -> Any:
     Create an instance of 'type_fq' without calling __init__, then set attributes
     from the provided 'state' dict (best-effort, private names allowed).
     """
-    mod_name, cls_name = type_fq.rsplit(".", 1)
+    mod_name, _, cls_name = type_fq.rpartition(".")
     cls = getattr(importlib.import_module(mod_name), cls_name)
     inst = object.__new__(cls)
     for k, v in (state or {}).items():
@@ -84,7 +87,7 @@ def drop_self_placeholder(args: tuple, self_type: Optional[str]) -> tuple:
     """
     if not args or not self_type or not isinstance(args[0], str):
         return args
-    cls_name = self_type.rsplit(".", 1)[1]
+    cls_name = self_type.rpartition(".")[2]
     s0 = args[0]
     if s0.startswith("<") and cls_name in s0:
         return args[1:]
@@ -110,7 +113,7 @@ def inject_object_args(
     # Detect whether args[0] is a self placeholder like "<Cls object at 0x...>"
     shift = 0
     if self_type and args and isinstance(args[0], str):
-        cls_name = self_type.rsplit(".", 1)[-1]
+        cls_name = self_type.rpartition(".")[2]
         if args[0].startswith("<") and cls_name in args[0]:
             shift = 1
 
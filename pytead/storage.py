@@ -1,6 +1,7 @@
 import ast
 import json
 import logging
+import os
 import pickle
 import pprint
 import uuid
@@ -18,6 +19,11 @@ from datetime import datetime
 from dataclasses import asdict
 from .errors import GraphJsonOrphanRef
 
+try:  # optional C decoder for graph-json traces (pip install pytead[fast])
+    import orjson as _orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    _orjson = None
+
 log = logging.getLogger("pytead.storage")
 
 
@@ -54,6 +60,19 @@ def _to_literal(obj: Any) -> Any:
 
 
 
+# Directories already created (or found) by this process. Every recorded call
+# writes into the same storage dir; mkdir(exist_ok=True) costs a mkdir + stat
+# each time, twice per trace (make_path, then _atomic_write).
+_KNOWN_DIRS: set = set()
+
+
+def _ensure_dir(d: Path) -> None:
+    key = os.fspath(d)
+    if key not in _KNOWN_DIRS:
+        d.mkdir(parents=True, exist_ok=True)
+        _KNOWN_DIRS.add(key)
+
+
 def _atomic_write(
     path: Path,
     *,
@@ -70,16 +89,22 @@ def _atomic_write(
       - best-effort cleanup on failure.
     The caller provides `write_fn(tmp_file)` to perform the actual write.
     """
-    import os, tempfile
+    import tempfile
     tmp_name = None
     try:
-        path.parent.mkdir(parents=True, exist_ok=True)
-        with tempfile.NamedTemporaryFile(
-            mode,
-            delete=False,
-            dir=str(path.parent),
-            **(open_kwargs or {})
-        ) as tmp:
+        _ensure_dir(path.parent)
+        try:
+            tmp_cm = tempfile.NamedTemporaryFile(
+                mode, delete=False, dir=str(path.parent), **(open_kwargs or {})
+            )
+        except FileNotFoundError:
+            # Directory removed behind our back since it was memoized: recreate.
+            _KNOWN_DIRS.discard(os.fspath(path.parent))
+            _ensure_dir(path.parent)
+            tmp_cm = tempfile.NamedTemporaryFile(
+                mode, delete=False, dir=str(path.parent), **(open_kwargs or {})
+            )
+        with tmp_cm as tmp:
             write_fn(tmp)
             try:
                 tmp.flush()
@@ -98,13 +123,18 @@ def _atomic_write(
         raise
 
 
+def _file_prefix(func_fullname: str) -> str:
+    """Filename prefix of the traces of `func_fullname` (see `make_path`)."""
+    return func_fullname.replace(".", "_")
+
+
 class _BaseStorage:
     extension = ""
 
     def make_path(self, storage_dir: Path, func_fullname: str) -> Path:
-        prefix = func_fullname.replace(".", "_")
+        prefix = _file_prefix(func_fullname)
         filename = f"{prefix}__{uuid.uuid4().hex}{self.extension}"
-        storage_dir.mkdir(parents=True, exist_ok=True)
+        _ensure_dir(storage_dir)
         return storage_dir / filename
 
 
@@ -284,8 +314,14 @@ class GraphJsonStorage(_BaseStorage):
             )
 
     def load(self, path: Path) -> Dict[str, Any]:
-        with path.open("r", encoding="utf-8") as f:
-            return json.load(f)
+        raw = path.read_bytes()
+        if _orjson is not None:
+            try:
+                return _orjson.loads(raw)
+            except _orjson.JSONDecodeError:
+                # NaN/Infinity or ints beyond 64 bits: only stdlib json accepts them.
+                pass
+        return json.loads(raw)
 
 
 
@@ -316,14 +352,67 @@ def storages_from_names(names: Optional[List[str]]) -> List[StorageLike]:
     return [get_storage(n) for n in names]
 
 
+# Below this many files per format, a thread pool costs more than it saves.
+_PARALLEL_LOAD_MIN = 32
+
+
+def _load_paths(st: StorageLike, paths: List[Path]) -> Iterable[tuple]:
+    """
+    Yield `(path, entry, exc)` for each path, in order.
+
+    Loading is mostly file I/O, so large batches overlap it in a thread pool;
+    logging and validation stay with the caller, on the consuming thread.
+    """
+    def _load(p: Path) -> tuple:
+        try:
+            return p, st.load(p), None
+        except Exception as exc:
+            return p, None, exc
+
+    if len(paths) < _PARALLEL_LOAD_MIN:
+        yield from map(_load, paths)
+        return
+    from concurrent.futures import ThreadPoolExecutor
+
+    with ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 4)) as ex:
+        yield from ex.map(_load, paths)
+
+
 def iter_entries(
-    calls_dir: Path, formats: Optional[List[str]] = None
+    calls_dir: Path,
+    formats: Optional[List[str]] = None,
+    only_funcs: Optional[Iterable[str]] = None,
 ) -> Iterable[TraceEntry]:
-    for st in storages_from_names(formats):
-         for p in sorted(calls_dir.glob(f"*{st.extension}")):
-             try:
-                entry = st.load(p)
-             except Exception as exc:
+    """
+    Yield the valid trace entries found in `calls_dir`.
+
+    With `only_funcs`, files whose name (`<func_with_underscores>__<uuid><ext>`,
+    see `make_path`) cannot belong to one of those functions are skipped without
+    being decoded. This is only a prefilter: callers still match on `entry["func"]`.
+    """
+    prefixes = None
+    if only_funcs is not None:
+        prefixes = {_file_prefix(f) for f in only_funcs}
+    storages = storages_from_names(formats)
+    # One directory scan for all formats, bucketed by extension.
+    by_ext: Dict[str, List[str]] = {st.extension: [] for st in storages}
+    try:
+        with os.scandir(calls_dir) as it:
+            for de in it:
+                name = de.name
+                if prefixes is not None and name.rpartition("__")[0] not in prefixes:
+                    continue
+                for ext, names in by_ext.items():
+                    if name.endswith(ext):
+                        if de.is_file():
+                            names.append(name)
+                        break
+    except FileNotFoundError:
+        return
+    for st in storages:
+         paths = [calls_dir / name for name in sorted(by_ext[st.extension])]
+         for p, entry, exc in _load_paths(st, paths):
+             if exc is not None:
                  log.warning("Skipping corrupt trace %s: %s", p, exc)
                  continue
              # Normalize shapes (args tuple, kwargs dict) and run a cheap invariant gate
@@ -3,8 +3,10 @@ from __future__ import annotations
 import inspect
 import importlib
 import logging
+import sys
 from dataclasses import dataclass
-from typing import Any, Iterable, List, Set, Tuple
+from types import ModuleType
+from typing import Any, Dict, Iterable, List, Set, Tuple
 
 from .tracing import trace
 from .errors import TargetResolutionError
@@ -31,19 +33,31 @@ def _import_longest_prefix(fq: str):
     parts = fq.split(".")
     for i in range(len(parts), 0, -1):
         mod_name = ".".join(parts[:i])
-        try:
-            mod = importlib.import_module(mod_name)
-            return mod, parts[i:]
-        except Exception:
-            continue
+        # Already imported: a dict lookup instead of the import machinery.
+        mod = sys.modules.get(mod_name)
+        if mod is None:
+            try:
+                mod = importlib.import_module(mod_name)
+            except Exception:
+                continue
+        return mod, parts[i:]
     raise ImportError(f"Cannot import any prefix of '{fq}'")
 
 
+# fq -> (module it was resolved through, result). A hit is only trusted while
+# that module is still the one registered in sys.modules (reloads, purges).
+_RESOLVE_CACHE: Dict[str, Tuple[ModuleType, ResolvedTarget]] = {}
+
+
 def resolve_target(fq: str) -> ResolvedTarget:
     """
     Resolve a fully-qualified target (function or method) and classify its kind.
     Uses inspect.getattr_static to avoid triggering descriptors during detection.
+    Successful resolutions are memoized per `fq` (failures are not).
     """
+    hit = _RESOLVE_CACHE.get(fq)
+    if hit is not None and sys.modules.get(hit[0].__name__) is hit[0]:
+        return hit[1]
     mod, tail = _import_longest_prefix(fq)
     if not tail:
         raise AttributeError(f"No attribute after module in '{fq}'")
@@ -62,7 +76,9 @@ def resolve_target(fq: str) -> ResolvedTarget:
     else:
         # Conservative fallback: treat as plain function/callable attr
         kind = "func"
-    return ResolvedTarget(owner=owner, attr=attr, kind=kind)
+    rt = ResolvedTarget(owner=owner, attr=attr, kind=kind)
+    _RESOLVE_CACHE[fq] = (mod, rt)
+    return rt
 
 
 def instrument_targets(
@@ -104,20 +120,26 @@ def instrument_targets(
         include_private_objects,
     )
 
-    # 1) Resolve all targets first so we can surface a consolidated error
-    for t in targets:
+    # Diagnostics below (owner lookups, post-condition re-fetch) only run when
+    # they would actually be emitted.
+    diag = log.isEnabledFor(logging.INFO)
+
+    # 1) Resolve all targets first so we can surface a consolidated error.
+    #    Duplicates are dropped up front: resolving (and wrapping) twice is wrong.
+    for t in dict.fromkeys(targets):
         try:
             rt = resolve_target(t)
             resolved.append((rt, t))
-            owner_file = getattr(rt.owner, "__file__", None)
-            owner_name = getattr(rt.owner, "__name__", type(rt.owner).__name__)
-            log.info(
-                "Resolved %s -> owner=%s file=%s kind=%s",
-                t,
-                owner_name,
-                owner_file,
-                rt.kind,
-            )
+            if diag:
+                owner_file = getattr(rt.owner, "__file__", None)
+                owner_name = getattr(rt.owner, "__name__", type(rt.owner).__name__)
+                log.info(
+                    "Resolved %s -> owner=%s file=%s kind=%s",
+                    t,
+                    owner_name,
+                    owner_file,
+                    rt.kind,
+                )
         except Exception as exc:
             errors.append(f"Cannot resolve target '{t}': {exc}")
 
@@ -171,18 +193,19 @@ def instrument_targets(
                 setattr(rt.owner, name, wrapped)
 
             # Post-condition: did we really install a wrapped function?
-            try:
-                installed = getattr(rt.owner, name)
-                if isinstance(installed, (staticmethod, classmethod)):
-                    base = installed.__func__
-                else:
-                    base = installed
-                has_wrapped = hasattr(base, "__wrapped__")
-            except Exception:
-                has_wrapped = False
-
-            owner_name = getattr(rt.owner, "__name__", type(rt.owner).__name__)
-            log.info("Wrapped %s on %s (has_wrapped=%s)", name, owner_name, has_wrapped)
+            if diag:
+                try:
+                    installed = getattr(rt.owner, name)
+                    if isinstance(installed, (staticmethod, classmethod)):
+                        base = installed.__func__
+                    else:
+                        base = installed
+                    has_wrapped = hasattr(base, "__wrapped__")
+                except Exception:
+                    has_wrapped = False
+
+                owner_name = getattr(rt.owner, "__name__", type(rt.owner).__name__)
+                log.info("Wrapped %s on %s (has_wrapped=%s)", name, owner_name, has_wrapped)
 
             seen.add(fq)
 
@@ -1012,8 +1012,7 @@ def run_case(func_fq: str, case: Case) -> None:
 Case = Tuple[Any, Any, Any, Any, Any, Any, Any]  # (args, kwargs, expected, self_type, self_state, obj_args, result_spec)
 
 def _id_from_args_kwargs(args: tuple, kwargs: dict, maxlen: int) -> str:
-    base = repr(args) if not kwargs else f"{repr(args)} {repr(kwargs)}"
-    return base if len(base) <= maxlen else base[: maxlen - 3] + "..."
+    return _case_id(args, kwargs, maxlen)
 
 def param_ids(cases: Sequence[Case], maxlen: int = 80) -> List[str]:
     """Generate readable IDs for pytest.parametrize from legacy cases."""
@@ -0,0 +1,18 @@
+# tests/conftest.py
+import pytest
+
+from pytead import targets
+from pytead.cli.config_cli import clear_config_cache
+
+
+@pytest.fixture(autouse=True)
+def _fresh_process_caches():
+    """
+    Packaged defaults, resolved paths and target resolutions are memoized per
+    process: each test starts (and leaves) with empty caches, whatever ran before.
+    """
+    clear_config_cache()
+    targets._RESOLVE_CACHE.clear()
+    yield
+    clear_config_cache()
+    targets._RESOLVE_CACHE.clear()
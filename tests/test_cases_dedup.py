@@ -0,0 +1,62 @@
+# tests/test_cases_dedup.py
+from pytead.cli._cli_utils import unique_count
+
+
+def test_unique_count_graphjson_dedups_by_value():
+    e1 = {"args_graph": [1, {"a": [2, 3]}], "kwargs_graph": {"k": 1}, "result_graph": 3}
+    e2 = {"args_graph": [1, {"a": [2, 3]}], "kwargs_graph": {"k": 1}, "result_graph": 3}
+    e3 = {"args_graph": [2], "kwargs_graph": {}, "result_graph": 4}
+    assert unique_count({"m.f": [e1, e2, e3]}) == 2
+
+
+def test_trace_case_kwargs_order_does_not_matter():
+    from pytead._cases import unique_cases
+
+    e1 = {"func": "m.f", "args": (1,), "kwargs": {"a": 1, "b": {"x": 1, "y": 2}}, "result": 0}
+    e2 = {"func": "m.f", "args": (1,), "kwargs": {"b": {"y": 2, "x": 1}, "a": 1}, "result": 0}
+    assert len(unique_cases([e1, e2])) == 1
+
+
+def test_pformat_cache_keeps_equal_but_distinct_values_apart():
+    from pytead._cases import _pformat_cached, clear_pformat_cache
+
+    clear_pformat_cache()
+    assert _pformat_cached((1,)) == "(1,)"
+    assert _pformat_cached([1]) == "[1]"
+    assert _pformat_cached((True,)) == "(True,)"
+    assert _pformat_cached({"a": 1.0}) == "{'a': 1.0}"
+    assert _pformat_cached({"a": 1}) == "{'a': 1}"
+    clear_pformat_cache()
+
+
+def test_unique_cases_reports_unhashable_values():
+    import pytest
+    from pytead._cases import unique_cases
+
+    class Unhashable:
+        __hash__ = None
+
+    with pytest.raises(TypeError, match="Failed to hash a TraceCase"):
+        unique_cases([{"func": "m.f", "args": (Unhashable(),), "kwargs": {}, "result": 0}])
+
+
+def test_unique_count_pickle_entries_matches_unique_cases():
+    from pytead._cases import unique_cases
+
+    entries = [
+        {"func": "m.f", "args": (1,), "kwargs": {}, "result": 1},
+        {"func": "m.f", "args": (1,), "kwargs": {}, "result": 1},
+        {"func": "m.f", "args": (2,), "kwargs": {"k": [1]}, "result": 2},
+    ]
+    assert unique_count({"m.f": entries}) == len(unique_cases(entries)) == 2
+
+
+def test_unique_count_graphjson_keeps_json_distinctions():
+    # Same JSON text once keys are sorted -> one case; 1 / 1.0 / true stay apart.
+    e1 = {"args_graph": [{"b": 1, "a": "x"}], "kwargs_graph": {}, "result_graph": 1}
+    e2 = {"args_graph": [{"a": "x", "b": 1}], "kwargs_graph": {}, "result_graph": 1}
+    e3 = {"args_graph": [{"a": "x", "b": 1}], "kwargs_graph": {}, "result_graph": 1.0}
+    e4 = {"args_graph": [{"a": "x", "b": 1}], "kwargs_graph": {}, "result_graph": True}
+    e5 = {"args_graph": ["ab"], "kwargs_graph": {}, "result_graph": None}
+    e6 = {"args_graph": ["a", "b"], "kwargs_graph": {}, "result_graph": None}
+    assert unique_count({"m.f": [e1, e2, e3, e4, e5, e6]}) == 5
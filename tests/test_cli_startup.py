@@ -0,0 +1,92 @@
+# tests/test_cli_startup.py
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from pytead.cli.main import _build_parser, _SUBCOMMANDS
+
+
+def _choices(parser):
+    (sub,) = [a for a in parser._actions if a.dest == "command"]
+    return set(sub.choices)
+
+
+def test_parser_only_builds_selected_subcommand():
+    assert _choices(_build_parser(["gen", "-s", "x"])) == {"gen"}
+
+
+@pytest.mark.parametrize("argv", [[], ["-h"], ["nope"], ["nope", "run"], ["-h", "gen"]])
+def test_parser_builds_all_subcommands_otherwise(argv):
+    assert _choices(_build_parser(argv)) == set(_SUBCOMMANDS)
+
+
+def _run_fresh(code: str) -> str:
+    """Run `code` in a fresh interpreter from the repo root; return its stdout."""
+    root = Path(__file__).resolve().parents[1]
+    out = subprocess.run(
+        [sys.executable, "-c", code], cwd=root, capture_output=True, text=True, check=True
+    )
+    return out.stdout
+
+
+def _modules_loaded_after(code: str, modules) -> list[str]:
+    """Which of `modules` a fresh interpreter has imported after running `code`."""
+    probe = f"\nimport sys\nprint(','.join(m for m in {tuple(modules)!r} if m in sys.modules))\n"
+    return [m for m in _run_fresh(code + probe).strip().split(",") if m]
+
+
+_CONFIG_LAYER = ("pytead.gen_tests", "pytead.cli._cli_utils", "pytead.cli.config_cli")
+
+
+@pytest.mark.parametrize(
+    "code, forbidden",
+    [
+        (
+            "import pytead.cli.cmd_run, pytead.cli.cmd_tead, pytead.cli.cmd_gen, pytead.cli.cmd_types",
+            ("runpy", "pytead.gen_tests", "pytead.cli.service_cli"),
+        ),
+        (
+            "import pytead.cli.service_cli",
+            ("runpy", "pytead.gen_tests", "pytead.targets", "pytead.imports",
+             "pytead.cli._cli_utils", "pytead.cli.config_cli"),
+        ),
+        *(
+            (f"from pytead.cli.main import _build_parser; _build_parser([{name!r}])", _CONFIG_LAYER)
+            for name in sorted(_SUBCOMMANDS)
+        ),
+    ],
+)
+def test_startup_does_not_load_heavy_modules(code, forbidden):
+    assert _modules_loaded_after(code, forbidden) == []
+
+
+def test_help_lists_commands_without_importing_them():
+    code = (
+        "import sys\n"
+        "from pytead.cli.main import _build_parser\n"
+        "text = _build_parser([]).format_help()\n"
+        "loaded = [m for m in sys.modules if m.startswith('pytead.cli.cmd_')]\n"
+        "print(','.join(loaded)); print(text)\n"
+    )
+    loaded, _, text = _run_fresh(code).partition("\n")
+    assert loaded == ""
+    for name, (_m, _a, help_text) in _SUBCOMMANDS.items():
+        assert name in text and help_text in text
+
+
+@pytest.mark.parametrize("name", sorted(_SUBCOMMANDS))
+def test_registry_help_matches_real_subparser(name):
+    parser = _build_parser([name])
+    (sub,) = [a for a in parser._actions if a.dest == "command"]
+    (choice,) = sub._choices_actions
+    assert choice.help == _SUBCOMMANDS[name][2]
+
+
+def test_types_keeps_its_own_option_help():
+    parser = _build_parser(["types"])
+    (sub,) = [a for a in parser._actions if a.dest == "command"]
+    helps = {a.dest: a.help for a in sub.choices["types"]._actions}
+    assert helps["output_dir"] == "write stub files (.pyi) under this directory (required via CLI or config)"
+    assert helps["storage_dir"] == "directory containing recorded traces (defaults via layered config)"
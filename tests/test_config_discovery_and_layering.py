@@ -86,6 +86,20 @@ def test_find_project_config_walks_up(tmp_path):
     assert found == nearest
 
 
+def test_find_project_config_file_kinds_and_priority(tmp_path):
+    """A directory named like a config is skipped; symlinks to files count; toml wins over yaml."""
+    proj = tmp_path / "proj"
+    (proj / ".pytead" / "config.toml").mkdir(parents=True)
+    real = _touch(tmp_path / "elsewhere.yaml")
+    (proj / ".pytead" / "config.yaml").symlink_to(real)
+    assert cfg._find_project_config(proj) == proj / ".pytead" / "config.yaml"
+
+    other = tmp_path / "other"
+    _touch(other / ".pytead" / "config.yml")
+    toml = _touch(other / ".pytead" / "config.toml")
+    assert cfg._find_project_config(other) == toml
+
+
 # -------- Layering tests: packaged < user < local --------
 
 
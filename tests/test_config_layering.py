@@ -1,6 +1,7 @@
 # tests/test_config_layering.py
 from pathlib import Path
 import argparse
+import sys
 import pytead.cli.config_cli as cfg
 
 
@@ -117,3 +118,161 @@ run:
 
     # No local config detected -> no project anchoring file
     assert ctx.source_path is None
+
+
+def test_effective_section_is_computed_once_per_context(tmp_path, monkeypatch):
+    packaged = """
+[defaults]
+storage_dir = "call_logs"
+[run]
+limit = 7
+"""
+    monkeypatch.setattr(cfg.ir, "files", lambda pkg: _DummyFiles(packaged))
+    monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path / "xdg"))
+    ctx = cfg.load_layered_config(start=tmp_path)
+
+    calls = []
+    real = cfg._effective
+    monkeypatch.setattr(cfg, "_effective", lambda sec, raw: calls.append(sec) or real(sec, raw))
+
+    first = cfg.effective_section(ctx, "run")
+    first["limit"] = 99  # callers get their own copy
+    second = cfg.effective_section(ctx, "run")
+
+    assert calls == ["run"]
+    assert second["limit"] == 7
+
+    cfg.diagnostics_for_storage_dir(ctx, "run", None)  # includes the full debug report
+    assert sorted(calls) == ["defaults", "gen", "run", "tead", "types"]
+
+
+def test_fallback_root_follows_markers_added_closer_to_the_anchor(tmp_path, monkeypatch):
+    monkeypatch.setattr(cfg.ir, "files", lambda pkg: _DummyFiles("[defaults]\nlimit = 1\n"))
+    monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path / "xdg"))
+    outer = tmp_path / "outer"
+    anchor = outer / "inner" / "pkg"
+    anchor.mkdir(parents=True)
+    _write(outer / "pyproject.toml", "")
+    assert cfg.load_layered_config(start=anchor).project_root == outer.resolve()
+
+    _write(outer / "inner" / "pyproject.toml", "")
+    assert cfg.load_layered_config(start=anchor).project_root == (outer / "inner").resolve()
+
+
+def test_resolve_under_project_root_memo_is_keyed_by_root(tmp_path):
+    ctx_a = cfg.ConfigContext(raw={}, project_root=tmp_path / "a", source_path=None)
+    ctx_b = cfg.ConfigContext(raw={}, project_root=tmp_path / "b", source_path=None)
+    ra = cfg.resolve_under_project_root(ctx_a, "calls")
+    assert cfg.resolve_under_project_root(ctx_a, "calls") is ra
+    assert cfg.resolve_under_project_root(ctx_b, "calls") == (tmp_path / "b" / "calls").resolve()
+
+
+def test_apply_config_skips_fill_when_cli_already_set_everything(caplog):
+    ctx = cfg.ConfigContext(
+        raw={"defaults": {"limit": 3}, "run": {"format": "pickle"}},
+        project_root=Path("/nonexistent"),
+        source_path=None,
+    )
+    ns = argparse.Namespace(limit=1, format="graph-json")
+    with caplog.at_level("INFO", logger="pytead.cli.config"):
+        cfg.apply_effective_to_args("run", ctx, ns)
+    assert (ns.limit, ns.format) == (1, "graph-json")
+    assert "Args BEFORE fill" not in caplog.text
+
+    ns = argparse.Namespace(limit=1, format="")
+    cfg.apply_effective_to_args("run", ctx, ns)
+    assert (ns.limit, ns.format) == (1, "pickle")
+
+
+def test_filled_lists_do_not_alias_the_memoized_section():
+    ctx = cfg.ConfigContext(
+        raw={"run": {"targets": ["m.f"]}}, project_root=Path("/nonexistent"), source_path=None
+    )
+    ns = argparse.Namespace(targets=None)
+    cfg.apply_effective_to_args("run", ctx, ns)
+    ns.targets.append("m.g")
+    assert cfg.effective_section(ctx, "run")["targets"] == ["m.f"]
+
+
+def test_resolve_memo_follows_symlinks_and_is_cleared(tmp_path):
+    a, b = tmp_path / "a", tmp_path / "b"
+    a.mkdir(), b.mkdir()
+    link = tmp_path / "link"
+    link.symlink_to(a, target_is_directory=True)
+    assert cfg.resolve_path(link) == a.resolve()
+
+    link.unlink()
+    link.symlink_to(b, target_is_directory=True)
+    assert cfg.resolve_path(link) == a.resolve()  # memoized until cleared
+    cfg.clear_config_cache()
+    assert cfg.resolve_path(link) == b.resolve()
+
+
+def test_effective_keys_are_interned():
+    raw = cfg._load_toml_text("[defaults]\n" + "storage" + "_dir = 'x'\n")
+    ctx = cfg.ConfigContext(raw=raw, project_root=Path("/nonexistent"), source_path=None)
+    (key,) = cfg.effective_section(ctx, "run")
+    assert key is sys.intern("storage_dir")
+
+
+def test_user_config_follows_env(tmp_path, monkeypatch):
+    monkeypatch.setattr(cfg.ir, "files", lambda pkg: _DummyFiles("[defaults]\nlimit = 1\n"))
+    monkeypatch.delenv("XDG_CONFIG_HOME", raising=False)
+    monkeypatch.setenv("HOME", str(tmp_path / "home"))
+    one = _write(tmp_path / "one.toml", "[defaults]\nlimit = 10\n")
+    two = _write(tmp_path / "two.toml", "[defaults]\nlimit = 20\n")
+    proj = tmp_path / "proj"
+    proj.mkdir()
+
+    monkeypatch.setenv("PYTEAD_CONFIG", str(one))
+    assert cfg.effective_section(cfg.load_layered_config(start=proj), "run")["limit"] == 10
+    monkeypatch.setenv("PYTEAD_CONFIG", str(two))
+    assert cfg.effective_section(cfg.load_layered_config(start=proj), "run")["limit"] == 20
+
+
+def test_packaged_defaults_parsed_once_per_text(tmp_path, monkeypatch):
+    cfg.clear_config_cache()
+    monkeypatch.setattr(cfg.ir, "files", lambda pkg: _DummyFiles("[defaults]\nlimit = 4\n"))
+    monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path / "xdg"))
+    parsed = []
+    real = cfg._load_toml_text
+    monkeypatch.setattr(cfg, "_load_toml_text", lambda txt: parsed.append(txt) or real(txt))
+
+    for name in ("a", "b"):
+        (tmp_path / name).mkdir()
+        ctx = cfg.load_layered_config(start=tmp_path / name)
+        assert cfg.effective_section(ctx, "run")["limit"] == 4
+    assert len(parsed) == 1
+
+
+def test_deep_merge_nested_override_leaves_inputs_untouched():
+    a = {"defaults": {"x": {"y": 1, "z": 2}, "keep": [1]}, "run": {"limit": 1}}
+    b = {"defaults": {"x": {"y": 10}, "new": True}, "gen": {}}
+    snapshot = repr((a, b))
+    out = cfg._deep_merge(a, b)
+    assert out == {
+        "defaults": {"x": {"y": 10, "z": 2}, "keep": [1], "new": True},
+        "run": {"limit": 1},
+        "gen": {},
+    }
+    assert repr((a, b)) == snapshot
+
+
+def test_debug_events_only_captured_on_request(tmp_path, monkeypatch):
+    monkeypatch.setattr(cfg.ir, "files", lambda pkg: _DummyFiles("[defaults]\nlimit = 1\n"))
+    monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path / "xdg"))
+    _write(tmp_path / ".pytead" / "config.toml", "[run]\ntoken = 'hunter2'\n")
+    hashed = []
+    monkeypatch.setattr(cfg, "_sha256_bytes", lambda b: hashed.append(b) or "x")
+
+    monkeypatch.delenv("PYTEAD_CONFIG_DEBUG", raising=False)
+    quiet = cfg.load_layered_config(start=tmp_path)
+    assert quiet.debug == [] and hashed == []
+    assert "PYTEAD_CONFIG_DEBUG" in cfg.render_config_debug_report(quiet)
+
+    monkeypatch.setenv("PYTEAD_CONFIG_DEBUG", "1")
+    loud = cfg.load_layered_config(start=tmp_path)
+    kinds = [ev["kind"] for ev in loud.debug]
+    assert "config_read_ok" in kinds and len(hashed) == 1
+    report = cfg.render_config_debug_report(loud)
+    assert "REDACTED" in report and "hunter2" not in report
@@ -1,5 +1,6 @@
 # tests/test_regressions_small.py
 import pytest
+from pathlib import Path
 
 def test_capture_depth_keeps_scalars_as_ints():
     """
@@ -73,3 +74,49 @@ def test_graph_to_data_set_basic_shapes(node, expected):
     assert type(res) is type(expected)
     assert res == expected
 
+
+
+def test_cli_exit_helpers_exit_instead_of_name_error():
+    """
+    `_sys` used to be imported only inside some helpers of `_cli_utils`; the
+    others hit a NameError instead of exiting cleanly.
+    """
+    import logging
+    from pytead.cli._cli_utils import require_targets_or_exit, require_output_dir_or_exit
+
+    log = logging.getLogger("pytead.tests")
+    with pytest.raises(SystemExit):
+        require_targets_or_exit([], ctx=None, logger=log)
+    with pytest.raises(SystemExit):
+        require_output_dir_or_exit(None, None, log, section="gen")
+
+
+def test_run_script_restores_sys_argv(tmp_path):
+    import sys
+    from pytead.cli.service_cli import run_script, RunStatus
+
+    script = tmp_path / "s.py"
+    script.write_text("import sys\nsys.argv.append('mutated')\n", encoding="utf-8")
+    argv = [str(script), "--flag"]
+    before = list(sys.argv)
+
+    outcome = run_script(script, argv)
+
+    assert outcome.status is RunStatus.OK
+    assert sys.argv == before
+    assert argv == [str(script), "--flag"]  # the caller's list is not handed out
+
+
+def test_script_path_follows_symlink_to_the_real_script(tmp_path):
+    """`pytead run -- bin/link.py`: the real script's directory is the import root, as with `python bin/link.py`."""
+    import logging
+    from pytead.cli._cli_utils import require_script_py_or_exit
+
+    real = tmp_path / "real" / "script.py"
+    real.parent.mkdir()
+    real.write_text("", encoding="utf-8")
+    link = tmp_path / "bin" / "link.py"
+    link.parent.mkdir()
+    link.symlink_to(Path("..") / "real" / "script.py")
+
+    assert require_script_py_or_exit([str(link)], logging.getLogger("pytead.tests")) == real.resolve()
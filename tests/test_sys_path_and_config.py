@@ -367,3 +367,28 @@ def test_tead_injects_paths_and_imports_from_yaml(tmp_path, monkeypatch, caplog)
     finally:
         os.chdir(old_cwd)
 
+
+
+def test_normalize_additional_sys_path_dedups_symlinked_relative_and_absolute(tmp_path):
+    from pytead.cli._cli_utils import normalize_additional_sys_path
+
+    project_root = tmp_path.resolve()
+    real = project_root / "src"
+    real.mkdir()
+    (project_root / "link").symlink_to(real, target_is_directory=True)
+
+    roots = normalize_additional_sys_path(project_root, ["link", str(real)])
+    assert roots == [str(project_root), str(real)]
+
+
+def test_resolve_additional_sys_path_follows_symlinks_like_normalize(tmp_path):
+    from pytead.cli._cli_utils import normalize_additional_sys_path, resolve_additional_sys_path
+
+    project_root = tmp_path.resolve()
+    real = project_root / "src"
+    real.mkdir()
+    (project_root / "link").symlink_to(real, target_is_directory=True)
+
+    raw = ["link", str(real), "link"]
+    assert resolve_additional_sys_path(project_root, raw) == [str(real)]
+    assert normalize_additional_sys_path(project_root, raw)[1:] == [str(real)]
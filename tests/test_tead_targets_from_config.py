@@ -51,3 +51,41 @@ def test_instrument_targets_writes(tmp_path, monkeypatch, storage_name, ext):
 
 
 
+
+
+def test_resolve_target_memo_follows_sys_modules(tmp_path, monkeypatch):
+    from pytead.targets import resolve_target
+
+    write(tmp_path / "memopkg" / "__init__.py", "def f(x): return x")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    purge_modules("memopkg")
+
+    first = resolve_target("memopkg.f")
+    assert resolve_target("memopkg.f") is first
+
+    # Once the module is purged, the cached owner is stale and must not be reused.
+    purge_modules("memopkg")
+    again = resolve_target("memopkg.f")
+    assert again is not first
+    assert again.owner is sys.modules["memopkg"]
+    purge_modules("memopkg")
+
+
+def test_instrument_targets_wraps_duplicates_once(tmp_path, monkeypatch):
+    from pytead.targets import instrument_targets
+    from pytead.storage import get_storage
+
+    write(tmp_path / "duppkg" / "__init__.py", "def f(x): return x + 1")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    purge_modules("duppkg")
+
+    seen = instrument_targets(
+        ["duppkg.f", "duppkg.f"], limit=5, storage_dir=tmp_path / "calls", storage=get_storage("pickle")
+    )
+    assert seen == {"duppkg.f"}
+
+    import duppkg
+    assert duppkg.f(1) == 2
+    assert inspect.unwrap(duppkg.f) is duppkg.f.__wrapped__
+    assert len(list((tmp_path / "calls").glob("duppkg_f__*.pkl"))) == 1
+    purge_modules("duppkg")
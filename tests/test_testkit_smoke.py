@@ -111,3 +111,18 @@ def test_instance_method_with_self_placeholder(mymod):
     case = ((placeholder, 5), {}, 15, f"{mymod}.Box", self_state, None, None)
     tk_run(f"{mymod}.Box.inc", case)
 
+
+
+@pytest.mark.parametrize(
+    "args, kwargs",
+    [
+        ((1,), {}),
+        ((1, [2, 3]), {"b": {"k": (4,)}}),
+        ((list(range(500)),), {}),
+        (({"x": "y" * 300},), {"z": 1}),
+    ],
+)
+def test_param_ids_match_clipped_repr(args, kwargs):
+    base = repr(args) if not kwargs else f"{repr(args)} {repr(kwargs)}"
+    expected = base if len(base) <= 80 else base[:77] + "..."
+    assert tk_ids([(args, kwargs, None)]) == [expected]
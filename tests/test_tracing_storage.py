@@ -135,3 +135,46 @@ def test_repr_storage_preserves_int_keys(tmp_path: Path):
     assert (2, 3) in e["kwargs"] and e["kwargs"][(2, 3)] == "b"
     assert 10 in e["result"] and e["result"][10] == "x"
     assert (4, 5) in e["result"] and e["result"][(4, 5)] == "y"
+
+
+def test_iter_entries_only_funcs_skips_other_files(tmp_path: Path):
+    st = PickleStorage()
+    for func in ("pkg.mod.f", "pkg.mod.g"):
+        entry = {"trace_schema": "pytead/v1", "func": func, "args": (), "kwargs": {}, "result": 1}
+        st.dump(entry, st.make_path(tmp_path, func))
+    # A file of another function that would not even decode
+    (tmp_path / "pkg_mod_g__deadbeef.pkl").write_bytes(b"not a pickle")
+
+    funcs = [e["func"] for e in iter_entries(tmp_path, formats=["pickle"], only_funcs={"pkg.mod.f"})]
+    assert funcs == ["pkg.mod.f"]
+
+
+def test_iter_entries_parallel_load_keeps_order(tmp_path: Path):
+    from pytead import storage as storage_mod
+
+    st = PickleStorage()
+    n = storage_mod._PARALLEL_LOAD_MIN + 5
+    for i in range(n):
+        entry = {"trace_schema": "pytead/v1", "func": "m.f", "args": (i,), "kwargs": {}, "result": i}
+        st.dump(entry, tmp_path / f"m_f__{i:04d}.pkl")
+    (tmp_path / "m_f__0003x.pkl").write_bytes(b"corrupt")
+
+    got = [e["args"][0] for e in iter_entries(tmp_path, formats=["pickle"])]
+    assert got == list(range(n))
+
+
+def test_storage_dir_recreated_if_removed_after_first_write(tmp_path: Path):
+    import shutil
+
+    st = PickleStorage()
+    calls = tmp_path / "calls"
+
+    @trace(limit=10, storage_dir=calls, storage=st)
+    def inc(x: int) -> int:
+        return x + 1
+
+    inc(1)
+    shutil.rmtree(calls)  # memoized as existing, now gone
+    inc(2)
+
+    assert count(calls, "*.pkl") == 1